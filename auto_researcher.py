@@ -12,6 +12,8 @@ Uso:
 """
 
 import asyncio
+import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -19,7 +21,7 @@ from loguru import logger
 
 # Imports do PyOS
 from pyos.core import SecurityShield, get_settings
-from pyos.core.orchestrator import PyOSOrchestrator, ModelProvider
+from pyos.core.orchestrator import PyOSOrchestrator, ModelProvider, dumps_payload
 from pyos.tools import CommandExecutor, VisionScreenCapture
 
 
@@ -27,17 +29,35 @@ from pyos.tools import CommandExecutor, VisionScreenCapture
 # CONFIGURATION
 # ==============================================================================
 
-# Configurar logging
+# Configurar logging: sink nativo de stderr (sem hop por lambda+print),
+# formatação em thread de background e cor apenas em terminal interativo
 logger.remove()
 logger.add(
-    lambda msg: print(msg, end=''),
-    colorize=True,
-    format="<level>{message}</level>"
+    sys.stderr,
+    colorize=sys.stderr.isatty(),
+    format="<level>{message}</level>",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
 )
 
 # Desktop path (para salvar PDF)
 DESKTOP_PATH = Path.home() / "Desktop"
 
+# Resultado do stat do Desktop, feito uma única vez por processo
+_DESKTOP_STAT = None
+
+
+def _desktop() -> Optional[Path]:
+    """Retorna DESKTOP_PATH se existir, cacheando o stat inicial."""
+    global _DESKTOP_STAT
+    if _DESKTOP_STAT is None:
+        try:
+            _DESKTOP_STAT = DESKTOP_PATH.stat()
+        except FileNotFoundError:
+            _DESKTOP_STAT = False
+    return DESKTOP_PATH if _DESKTOP_STAT else None
+
 
 # ==============================================================================
 # SETUP FUNCTIONS
@@ -50,27 +70,18 @@ def setup_security() -> SecurityShield:
     IMPORTANTE: Apenas comandos essenciais são permitidos!
     """
     shield = SecurityShield()
-    
-    # Comandos para abrir navegador
-    shield.add_allowed_command("firefox")
-    shield.add_allowed_command("chromium")
-    shield.add_allowed_command("google-chrome")
-    shield.add_allowed_command("xdg-open")
-    
-    # Comandos para salvar arquivos
-    shield.add_allowed_command("wget")
-    shield.add_allowed_command("curl")
-    shield.add_allowed_command("grep")
-    shield.add_allowed_command("find")
-    
-    # PDF generation
-    shield.add_allowed_command("wkhtmltopdf")
-    shield.add_allowed_command("python3")
-    
-    # Permitir Desktop
-    try:
+
+    # Navegador, download/busca e geração de PDF em uma única atualização
+    shield.add_allowed_commands((
+        "firefox", "chromium", "google-chrome", "xdg-open",
+        "wget", "curl", "grep", "find",
+        "wkhtmltopdf", "python3",
+    ))
+    
+    # Permitir Desktop (stat cacheado, sem segundo syscall)
+    if _desktop() is not None:
         shield.add_allowed_path(DESKTOP_PATH)
-    except ValueError:
+    else:
         logger.warning(f"Desktop não existe: {DESKTOP_PATH}")
     
     # Permitir /tmp para arquivos temporários
@@ -84,10 +95,24 @@ def setup_security() -> SecurityShield:
     return shield
 
 
+# Orquestradores reutilizados entre execuções, por (provider, allow-list)
+_orchestrators: dict = {}
+
+
 def setup_orchestrator(shield: SecurityShield) -> PyOSOrchestrator:
     """
     Inicializar orquestrador com ferramentas de pesquisa.
+
+    Reusa a instância cacheada quando o provider e a allow-list do
+    shield são os mesmos, evitando recarregar plugins e reabrir a
+    captura de tela a cada execução de exemplo.
     """
+    cache_key = (ModelProvider.OPENAI, tuple(sorted(shield.allowed_commands)))
+    cached = _orchestrators.get(cache_key)
+    if cached is not None:
+        logger.debug("Reutilizando orquestrador cacheado")
+        return cached
+
     settings = get_settings()
     
     orchestrator = PyOSOrchestrator(
@@ -101,25 +126,37 @@ def setup_orchestrator(shield: SecurityShield) -> PyOSOrchestrator:
     executor = CommandExecutor(shield=shield)
     vision = VisionScreenCapture()
     
-    # Ferramenta: Capturar tela
+    # Ferramenta: Gerar regiões clicáveis
+    # Cache com TTL curto: se take_screenshot acabou de capturar a tela,
+    # reaproveita o frame em vez de capturar de novo na mesma iteração.
+    capture_cache: dict = {"ts": 0.0, "frame": None}
+    capture_ttl = 0.1  # segundos
+
+    def capture_screen_cached():
+        now = time.monotonic()
+        if capture_cache["frame"] is None or now - capture_cache["ts"] >= capture_ttl:
+            capture_cache["frame"] = vision.capture_screen()
+            capture_cache["ts"] = now
+        return capture_cache["frame"]
+
+    def get_clickable_regions():
+        capture = capture_screen_cached()
+        return vision.generate_clickable_regions(grid_cols=5, grid_rows=3, capture=capture)
+
+    # Ferramenta: Capturar tela (compartilha o cache com get_clickable_regions)
     orchestrator.register_tool(
         name="take_screenshot",
-        func=vision.capture_screen,
+        func=capture_screen_cached,
         description="Tira captura de tela para ver estado atual da tela",
     )
-    
+
     # Ferramenta: Executar comando
     orchestrator.register_tool(
         name="execute_command",
         func=executor.execute,
         description="Executa comando de terminal (validado por SecurityShield)",
     )
-    
-    # Ferramenta: Gerar regiões clicáveis
-    def get_clickable_regions():
-        capture = vision.capture_screen()
-        return vision.generate_clickable_regions(grid_cols=5, grid_rows=3, capture=capture)
-    
+
     orchestrator.register_tool(
         name="get_clickable_regions",
         func=get_clickable_regions,
@@ -127,7 +164,8 @@ def setup_orchestrator(shield: SecurityShield) -> PyOSOrchestrator:
     )
     
     logger.info(f"✓ Orquestrador inicializado com {len(orchestrator.tools)} ferramentas")
-    
+
+    _orchestrators[cache_key] = orchestrator
     return orchestrator
 
 
@@ -193,18 +231,18 @@ async def run_auto_researcher(
     if result.get('final_message'):
         logger.info(f"Mensagem final: {result['final_message']}")
     
-    # Log de ações
+    # Log de ações (serialização em lote, orjson quando disponível)
     if result.get('action_log'):
         logger.info(f"\n📋 Log de {len(result['action_log'])} ações:")
-        for action in result['action_log'][:5]:  # Mostrar primeiras 5
-            logger.info(f"  - {action['type']}: {action.get('tool', 'N/A')}")
+        logger.info(dumps_payload(result['action_log'][:5]))  # Mostrar primeiras 5
     
-    # Verificar resultado
+    # Verificar resultado (um único stat cobre existência + tamanho)
     output_path = DESKTOP_PATH / output_filename
-    if output_path.exists():
+    try:
+        st = output_path.stat()
         logger.info(f"\n✓ Resultado salvo em: {output_path}")
-        logger.info(f"  Tamanho: {output_path.stat().st_size} bytes")
-    else:
+        logger.info(f"  Tamanho: {st.st_size} bytes")
+    except FileNotFoundError:
         logger.warning(f"⚠️  Arquivo esperado não encontrado: {output_path}")
     
     return result
@@ -233,35 +271,35 @@ def example_simple_screenshot():
         logger.error(f"Erro: {e}")
 
 
-def example_command_execution():
-    """Exemplo: Executar comando seguro."""
+async def example_command_execution():
+    """Exemplo: Executar comando seguro (sem bloquear o event loop)."""
     logger.info("\n=== Exemplo 2: Execução de Comando ===\n")
-    
+
     try:
         shield = setup_security()
         executor = CommandExecutor(shield=shield)
-        
-        # Executar comando permitido
-        result = executor.execute("ls -la /tmp")
-        
+
+        # Executar comando permitido (subprocess bloqueante vai para thread)
+        result = await asyncio.to_thread(executor.execute, "ls -la /tmp")
+
         if result.success:
             logger.info(f"✓ Comando bem-sucedido")
             logger.info(f"  Saída (primeiras 100 chars): {result.stdout[:100]}")
         else:
             logger.error(f"✗ Comando falhou: {result.stderr}")
-        
+
         # Tentar comando não permitido
         logger.info("\nTentando comando não permitido...")
-        result = executor.execute("rm -rf /tmp/test")
-        
+        result = await asyncio.to_thread(executor.execute, "rm -rf /tmp/test")
+
         if not result.success:
             logger.warning(f"✓ Comando bloqueado corretamente: {result.error}")
-        
+
     except Exception as e:
         logger.error(f"Erro: {e}")
 
 
-def example_security_test():
+async def example_security_test():
     """Exemplo: Testar segurança."""
     logger.info("\n=== Exemplo 3: Teste de Segurança ===\n")
     
@@ -308,23 +346,28 @@ async def main():
     print("3. Exemplo: Teste de Segurança")
     print("4. DEMO COMPLETA: Pesquisa Autônoma (requer IA configurada)")
     print("0. Sair")
-    
-    choice = input("\nEscolha (0-4): ").strip()
+
+    # Pré-aquece as configurações enquanto o usuário digita
+    warm_settings = asyncio.create_task(asyncio.to_thread(get_settings))
+
+    # input() em thread para não bloquear o event loop
+    choice = (await asyncio.to_thread(input, "\nEscolha (0-4): ")).strip()
     
     if choice == "1":
         example_simple_screenshot()
     elif choice == "2":
-        example_command_execution()
+        await example_command_execution()
     elif choice == "3":
-        example_security_test()
+        await example_security_test()
     elif choice == "4":
         print("\n⚠️  Este exemplo requer:")
         print("  1. Variável OPENAI_API_KEY configurada")
         print("  2. Navegador Chrome/Firefox instalado")
         print("  3. Ambiente Linux/MacOS")
         
-        confirm = input("\nDeseja continuar? (s/n): ").lower()
+        confirm = (await asyncio.to_thread(input, "\nDeseja continuar? (s/n): ")).lower()
         if confirm == "s":
+            await warm_settings
             result = await run_auto_researcher()
             
             if result['success']:
@@ -8,10 +8,10 @@ from BaseTool without requiring manual configuration.
 
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Standard result from any tool execution."""
     success: bool
@@ -19,15 +19,27 @@ class ToolResult:
     error: Optional[str] = None
     execution_time_ms: float = 0.0
     metadata: Optional[dict[str, Any]] = None
+    _output_preview: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def output_preview(self) -> str:
+        """
+        First 100 characters of the output, computed once and cached.
+
+        The orchestrator truncates the output in several places per
+        iteration (logging, history, memory writes); caching the slice
+        avoids re-copying large outputs (base64 screenshots, file dumps).
+        """
+        if self._output_preview is None:
+            # str() é redundante (e caro) quando output já é string
+            output = self.output if isinstance(self.output, str) else str(self.output)
+            self._output_preview = output[:100]
+        return self._output_preview
 
     def __str__(self) -> str:
         status = "✅" if self.success else "❌"
-        msg = f"{status} [{self.execution_time_ms:.0f}ms]"
-        if self.success:
-            msg += f": {str(self.output)[:100]}"
-        else:
-            msg += f": {self.error}"
-        return msg
+        tail = self.output_preview if self.success else self.error
+        return f"{status} [{self.execution_time_ms:.0f}ms]: {tail}"
 
 
 class BaseTool(ABC):
@@ -70,6 +82,14 @@ class BaseTool(ABC):
         """Whether this tool requires user approval before execution."""
         return False
 
+    @property
+    def parallel_safe(self) -> bool:
+        """
+        Whether this tool is side-effect-free and may run concurrently
+        with other tools in the same batch of AI tool calls.
+        """
+        return False
+
     @property
     def dangerous_patterns(self) -> list[str]:
         """List of regex patterns that should trigger approval."""
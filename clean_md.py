@@ -1,16 +1,59 @@
 import re
 import os
+import asyncio
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Regex to match characters that are typical of emojis/symbols
+# 2600-27BF are Miscellaneous Symbols and Dingbats
+# 1F000-1FFFF are Supplemental Symbols and Pictographs (Emojis)
+_EMOJI_RE = re.compile(r'[\U0001f000-\U0001ffff\u2600-\u27bf]', flags=re.UNICODE)
+
+# Abaixo deste tamanho o overhead de encode/decode supera o ganho do NumPy
+_NUMPY_MIN_LEN = 64_000
 
 def remove_emojis(text):
-    # Regex to match characters that are typical of emojis/symbols
-    # 2600-27BF are Miscellaneous Symbols and Dingbats
-    # 1F000-1FFFF are Supplemental Symbols and Pictographs (Emojis)
-    emoji_pattern = re.compile(r'[\U0001f000-\U0001ffff\u2600-\u27bf]', flags=re.UNICODE)
-    return emoji_pattern.sub('', text)
+    if np is not None and len(text) > _NUMPY_MIN_LEN:
+        # Fast path: view the string as UTF-32 codepoints and drop the emoji
+        # ranges with vectorized compares instead of the regex engine.
+        buf = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        if buf.size:
+            mask = (buf < 0x2600) | ((buf > 0x27BF) & (buf < 0x1F000)) | (buf > 0x1FFFF)
+            return buf[mask].tobytes().decode('utf-32-le')
+    return _EMOJI_RE.sub('', text)
 
 files = ['CONTRIBUTING_NEW.md', 'CONTRIBUTING.md', 'CODE_OF_CONDUCT.md', 'IMPLEMENTATION_SUMMARY.md', 'PROJECT_SUMMARY.md', 'README.md']
-for f in files:
-    if os.path.exists(f):
+
+async def process(f):
+    print(f"Lendo {f}...")
+    async with aiofiles.open(f, 'r', encoding='utf-8') as file:
+        content = await file.read()
+    # CPU-bound transform fica fora do event loop
+    loop = asyncio.get_running_loop()
+    new_content = await loop.run_in_executor(None, remove_emojis, content)
+    async with aiofiles.open(f, 'w', encoding='utf-8') as file:
+        await file.write(new_content)
+    print(f"Processado {f}")
+
+def _present_files():
+    # Um único scandir no lugar de um stat por arquivo
+    present = {e.name for e in os.scandir('.') if e.is_file()}
+    return [f for f in files if f in present]
+
+async def process_all():
+    await asyncio.gather(*(process(f) for f in _present_files()))
+
+def process_all_sync():
+    # Fallback sequencial quando aiofiles não está instalado
+    for f in _present_files():
         print(f"Lendo {f}...")
         with open(f, 'r', encoding='utf-8') as file:
             content = file.read()
@@ -18,3 +61,9 @@ for f in files:
         with open(f, 'w', encoding='utf-8') as file:
             file.write(new_content)
         print(f"Processado {f}")
+
+if __name__ == "__main__":
+    if aiofiles is not None:
+        asyncio.run(process_all())
+    else:
+        process_all_sync()
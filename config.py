@@ -15,12 +15,28 @@ Exemplo:
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import ClassVar, Optional
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from loguru import logger
 
 
+@lru_cache(maxsize=8)
+def _split_paths(raw: str) -> tuple[str, ...]:
+    """Divide e normaliza a string de caminhos uma única vez por valor."""
+    return tuple(p.strip() for p in raw.split(":") if p.strip())
+
+
+@lru_cache(maxsize=8)
+def _build_api_url(debug: bool, host: str, port: int) -> str:
+    """Monta a URL da API uma única vez por combinação de parâmetros."""
+    # Só usa HTTPS se não for localhost e debug estiver desativado
+    is_localhost = host in ("127.0.0.1", "localhost")
+    protocol = "http" if debug or is_localhost else "https"
+    return f"{protocol}://{host}:{port}"
+
+
 class Settings(BaseSettings):
     """
     Configurações da aplicação PyOS-Agent.
@@ -41,6 +57,9 @@ class Settings(BaseSettings):
         allowed_execution_paths: Caminhos permite para execução.
     """
 
+    # Evita repetir o log de inicialização a cada instância
+    _logged: ClassVar[bool] = False
+
     # Informações da aplicação
     app_name: str = "PyOS-Agent"
     app_version: str = "0.1.0"
@@ -82,10 +101,12 @@ class Settings(BaseSettings):
             **data: Valores para sobrescrever padrões.
         """
         super().__init__(**data)
-        logger.info(
-            f"Aplicação {self.app_name} v{self.app_version} "
-            f"inicializada em modo {'DEBUG' if self.debug else 'PRODUÇÃO'}"
-        )
+        if not Settings._logged:
+            logger.info(
+                f"Aplicação {self.app_name} v{self.app_version} "
+                f"inicializada em modo {'DEBUG' if self.debug else 'PRODUÇÃO'}"
+            )
+            Settings._logged = True
 
     def get_api_url(self) -> str:
         """
@@ -99,10 +120,7 @@ class Settings(BaseSettings):
             >>> settings.get_api_url()
             'http://127.0.0.1:8000'
         """
-        # Só usa HTTPS se não for localhost e debug estiver desativado
-        is_localhost = self.api_host in ("127.0.0.1", "localhost")
-        protocol = "http" if self.debug or is_localhost else "https"
-        return f"{protocol}://{self.api_host}:{self.api_port}"
+        return _build_api_url(self.debug, self.api_host, self.api_port)
 
     def get_allowed_paths(self) -> list[str]:
         """
@@ -122,11 +140,10 @@ class Settings(BaseSettings):
         """
         if not self.allowed_execution_paths:
             return []
-        
-        return [
-            p.strip() for p in self.allowed_execution_paths.split(":")
-            if p.strip()
-        ]
+
+        # Memoizado por valor da string: chamadas repetidas (uma por
+        # tool call) viram um lookup + cópia rasa, sem re-split/strip
+        return list(_split_paths(self.allowed_execution_paths))
 
     def to_dict(self) -> dict:
         """
@@ -150,13 +167,18 @@ class Settings(BaseSettings):
         }
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Factory para obter instância singleton de Settings.
-    
+
+    A instância é cacheada: chamadas subsequentes não re-parseiam o .env
+    nem re-executam validação Pydantic. Use get_settings.cache_clear()
+    em testes que alteram variáveis de ambiente.
+
     Returns:
         Instância de Settings com configurações carregadas do .env.
-        
+
     Example:
         >>> settings = get_settings()
         >>> print(settings.app_name)
@@ -1,335 +1,487 @@
-"""
-Terminal Dashboard using Rich library.
-
-Provides real-time telemetry visualization with multiple panels:
-- [PENSAMENTO DA IA] - AI reasoning and decisions
-- [AÇÃO EXECUTADA] - Current tool execution
-- [STATUS DE SEGURANÇA] - Security validation status
-- [MEMÓRIA RECALCADA] - Semantic memory recalls and learning
-"""
-
-from typing import Optional, Any
-from dataclasses import dataclass
-from datetime import datetime
-
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-    from rich.text import Text
-    from rich.columns import Columns
-except ImportError:
-    raise ImportError("Rich library required. Install with: pip install rich")
-
-from loguru import logger
-
-
-@dataclass
-class DashboardState:
-    """Current state of dashboard metrics."""
-    ai_reasoning: str = "Aguardando..."
-    ai_tool_decision: str = ""
-    current_tool: str = ""
-    tool_status: str = "idle"
-    tool_progress: float = 0.0
-    security_status: str = "✅ OK"
-    security_violations: int = 0
-    memory_recall_count: int = 0
-    memory_entries: int = 0
-    last_memory_recall: str = ""
-    iterations: int = 0
-    total_actions: int = 0
-    execution_time: float = 0.0
-
-
-class RichDashboard:
-    """
-    Terminal dashboard for PyOS-Agent telemetry.
-    
-    Displays 4 panels:
-    1. AI Thoughts (reasoning, decisions)
-    2. Tool Execution (current action, progress)
-    3. Security Status (validations, violations)
-    4. Memory Status (recalls, learning)
-    """
-
-    def __init__(self, width: int = 200, height: int = 30, update_interval: float = 0.5):
-        """
-        Initialize dashboard.
-        
-        Args:
-            width: Console width
-            height: Console height  
-            update_interval: Refresh rate in seconds
-        """
-        self.console = Console(width=width, height=height, force_terminal=True)
-        self.update_interval = update_interval
-        self.state = DashboardState()
-        self.is_running = False
-        self.live: Optional[Live] = None
-
-    def update_ai_reasoning(self, reasoning: str) -> None:
-        """Update AI reasoning panel."""
-        self.state.ai_reasoning = reasoning[:200]
-
-    def update_ai_decision(self, tool: str, reasoning: str = "") -> None:
-        """Update AI tool decision."""
-        self.state.ai_tool_decision = f"{tool}"
-        if reasoning:
-            self.state.ai_reasoning = reasoning[:200]
-        self.state.current_tool = tool
-
-    def update_tool_status(self, tool: str, status: str, progress: float = 0.0) -> None:
-        """Update tool execution status."""
-        self.state.current_tool = tool
-        self.state.tool_status = status
-        self.state.tool_progress = progress
-
-    def update_security_status(self, is_safe: bool, violations: int = 0) -> None:
-        """Update security status."""
-        if is_safe:
-            self.state.security_status = "✅ SEGURO"
-        else:
-            self.state.security_status = f"🚫 VIOLAÇÃO ({violations})"
-        self.state.security_violations = violations
-
-    def update_memory_recall(self, recall_count: int, total_entries: int, last_recall: str = "") -> None:
-        """Update memory recall status."""
-        self.state.memory_recall_count = recall_count
-        self.state.memory_entries = total_entries
-        self.state.last_memory_recall = last_recall[:100] if last_recall else ""
-
-    def update_metrics(
-        self,
-        iterations: int,
-        total_actions: int,
-        execution_time: float,
-    ) -> None:
-        """Update general metrics."""
-        self.state.iterations = iterations
-        self.state.total_actions = total_actions
-        self.state.execution_time = execution_time
-
-    def _build_layout(self) -> Layout:
-        """Build dashboard layout with 4 panels."""
-        layout = Layout(name="root")
-        layout.split_column(
-            Layout(name="header", size=3),
-            Layout(name="body"),
-            Layout(name="footer", size=2),
-        )
-
-        layout["body"].split_row(
-            Layout(name="left"),
-            Layout(name="right"),
-        )
-
-        layout["left"].split_column(
-            Layout(name="ai", size=15),
-            Layout(name="tool", size=15),
-        )
-
-        layout["right"].split_column(
-            Layout(name="security", size=15),
-            Layout(name="memory", size=15),
-        )
-
-        return layout
-
-    def _render_header(self) -> Panel:
-        """Render header panel with title and metrics."""
-        header_text = Text()
-        header_text.append("🤖 PyOS-Agent ", style="bold blue")
-        header_text.append("│ ", style="dim")
-        header_text.append(f"Iteração {self.state.iterations} ", style="yellow")
-        header_text.append("│ ", style="dim")
-        header_text.append(f"{self.state.total_actions} ações ", style="cyan")
-        header_text.append("│ ", style="dim")
-        header_text.append(f"{self.state.execution_time:.1f}s", style="green")
-
-        return Panel(
-            header_text,
-            border_style="blue",
-            padding=(0, 1),
-        )
-
-    def _render_ai_panel(self) -> Panel:
-        """Render AI thoughts panel."""
-        ai_text = Text()
-        ai_text.append("Raciocínio:\n", style="bold cyan")
-        ai_text.append(self.state.ai_reasoning, style="white")
-        
-        if self.state.ai_tool_decision:
-            ai_text.append("\n\n", style="")
-            ai_text.append("Decisão:\n", style="bold yellow")
-            ai_text.append(f"→ {self.state.ai_tool_decision}", style="bright_yellow")
-
-        return Panel(
-            ai_text,
-            title="[PENSAMENTO DA IA]",
-            border_style="cyan",
-            padding=(1, 2),
-        )
-
-    def _render_tool_panel(self) -> Panel:
-        """Render tool execution panel."""
-        tool_text = Text()
-        
-        if self.state.current_tool:
-            tool_text.append(f"Ferramenta: {self.state.current_tool}\n", style="bold green")
-            tool_text.append(f"Status: {self.state.tool_status}\n", style="yellow")
-            
-            # Progress bar
-            progress_pct = int(self.state.tool_progress * 100)
-            progress_bar = "█" * int(progress_pct / 5) + "░" * (20 - int(progress_pct / 5))
-            tool_text.append(f"[{progress_bar}] {progress_pct}%", style="green")
-        else:
-            tool_text.append("Nenhuma ferramenta em execução", style="dim")
-
-        return Panel(
-            tool_text,
-            title="[AÇÃO EXECUTADA]",
-            border_style="green",
-            padding=(1, 2),
-        )
-
-    def _render_security_panel(self) -> Panel:
-        """Render security status panel."""
-        security_text = Text()
-        
-        status_style = "green" if "SEGURO" in self.state.security_status else "red"
-        security_text.append(f"{self.state.security_status}\n", style=f"bold {status_style}")
-        
-        security_text.append(f"Violações: {self.state.security_violations}\n", style="yellow")
-        security_text.append("AllowList ✓\n", style="dim")
-        security_text.append("AST Analyzer ✓\n", style="dim")
-        security_text.append("Approval Manager ✓", style="dim")
-
-        return Panel(
-            security_text,
-            title="[STATUS DE SEGURANÇA]",
-            border_style=status_style,
-            padding=(1, 2),
-        )
-
-    def _render_memory_panel(self) -> Panel:
-        """Render memory status panel."""
-        memory_text = Text()
-        
-        memory_text.append(f"Entradas: {self.state.memory_entries}\n", style="bold cyan")
-        memory_text.append(f"Recalls: {self.state.memory_recall_count}\n", style="yellow")
-        
-        if self.state.last_memory_recall:
-            memory_text.append("\nÚltimo Recall:\n", style="dim")
-            memory_text.append(f"→ {self.state.last_memory_recall}", style="white")
-
-        return Panel(
-            memory_text,
-            title="[MEMÓRIA RECALCADA]",
-            border_style="magenta",
-            padding=(1, 2),
-        )
-
-    def _render_footer(self) -> Panel:
-        """Render footer with timestamp and status."""
-        footer_text = Text()
-        footer_text.append(f"🕐 {datetime.now().strftime('%H:%M:%S')}", style="dim")
-        footer_text.append(" │ ", style="dim")
-        footer_text.append("Press Ctrl+C to stop", style="dim")
-
-        return Panel(
-            footer_text,
-            border_style="dim",
-            padding=(0, 1),
-        )
-
-    def _generate_screen(self) -> Layout:
-        """Generate complete dashboard layout."""
-        layout = self._build_layout()
-
-        # Fill panels
-        layout["header"].update(self._render_header())
-        layout["ai"].update(self._render_ai_panel())
-        layout["tool"].update(self._render_tool_panel())
-        layout["security"].update(self._render_security_panel())
-        layout["memory"].update(self._render_memory_panel())
-        layout["footer"].update(self._render_footer())
-
-        return layout
-
-    def start(self) -> None:
-        """Start live dashboard."""
-        self.is_running = True
-        try:
-            self.live = Live(
-                self._generate_screen(),
-                console=self.console,
-                refresh_per_second=1 / self.update_interval,
-            )
-            self.live.start()
-            logger.info("Dashboard Rich iniciado")
-        except Exception as e:
-            logger.error(f"Erro ao iniciar dashboard: {e}")
-            self.is_running = False
-
-    def update(self) -> None:
-        """Update dashboard display."""
-        if self.live and self.is_running:
-            try:
-                self.live.update(self._generate_screen())
-            except Exception as e:
-                logger.error(f"Erro ao atualizar dashboard: {e}")
-
-    def stop(self) -> None:
-        """Stop live dashboard."""
-        if self.live:
-            self.live.stop()
-        self.is_running = False
-        logger.info("Dashboard Rich parado")
-
-    def print_summary(self) -> None:
-        """Print final execution summary."""
-        if not self.is_running:
-            return
-
-        self.console.print("\n")
-        self.console.rule("[bold green]Resumo da Execução[/bold green]")
-        
-        table = Table(title="Métricas Finais")
-        table.add_column("Métrica", style="cyan")
-        table.add_column("Valor", style="green")
-        
-        table.add_row("Iterações", str(self.state.iterations))
-        table.add_row("Ações Executadas", str(self.state.total_actions))
-        table.add_row("Tempo Total", f"{self.state.execution_time:.2f}s")
-        table.add_row("Violações de Segurança", str(self.state.security_violations))
-        table.add_row("Memória - Entradas", str(self.state.memory_entries))
-        table.add_row("Memória - Recalls", str(self.state.memory_recall_count))
-        
-        self.console.print(table)
-
-
-# Global dashboard instance
-_dashboard: Optional[RichDashboard] = None
-
-
-def get_dashboard() -> RichDashboard:
-    """Get or create global dashboard instance."""
-    global _dashboard
-    if _dashboard is None:
-        _dashboard = RichDashboard()
-    return _dashboard
-
-
-async def dashboard_context():
-    """Async context manager for dashboard lifecycle."""
-    dashboard = get_dashboard()
-    dashboard.start()
-    try:
-        yield dashboard
-    finally:
-        dashboard.stop()
-        dashboard.print_summary()
+"""
+Terminal Dashboard using Rich library.
+
+Provides real-time telemetry visualization with multiple panels:
+- [PENSAMENTO DA IA] - AI reasoning and decisions
+- [AÇÃO EXECUTADA] - Current tool execution
+- [STATUS DE SEGURANÇA] - Security validation status
+- [MEMÓRIA RECALCADA] - Semantic memory recalls and learning
+"""
+
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional, Any
+from dataclasses import dataclass
+from datetime import datetime
+
+try:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.layout import Layout
+    from rich.live import Live
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.style import Style
+    from rich.text import Text
+    from rich.columns import Columns
+except ImportError:
+    raise ImportError("Rich library required. Install with: pip install rich")
+
+from loguru import logger
+
+
+# Styles and static text fragments built once at import; renders clone
+# them instead of re-parsing style strings every frame.
+_STYLE_BOLD_CYAN = Style(bold=True, color="cyan")
+_STYLE_BOLD_YELLOW = Style(bold=True, color="yellow")
+_STYLE_BOLD_GREEN = Style(bold=True, color="green")
+_STYLE_BRIGHT_YELLOW = Style(color="bright_yellow")
+_STYLE_WHITE = Style(color="white")
+_STYLE_YELLOW = Style(color="yellow")
+_STYLE_GREEN = Style(color="green")
+_STYLE_CYAN = Style(color="cyan")
+_STYLE_DIM = Style(dim=True)
+
+_TEXT_RACIOCINIO = Text("Raciocínio:\n", style=_STYLE_BOLD_CYAN)
+_TEXT_DECISAO_HDR = Text("Decisão:\n", style=_STYLE_BOLD_YELLOW)
+_TEXT_SECURITY_STATIC = Text(
+    "AllowList ✓\nAST Analyzer ✓\nApproval Manager ✓", style=_STYLE_DIM
+)
+_TEXT_NO_TOOL = Text("Nenhuma ferramenta em execução", style=_STYLE_DIM)
+
+_STYLE_SEC_OK = Style(bold=True, color="green")
+_STYLE_SEC_VIOLATION = Style(bold=True, color="red")
+_STYLE_RED = Style(color="red")
+
+# 21 estados possíveis da barra de progresso (0..20 células cheias)
+_PROGRESS_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Painel ocioso pré-construído (estado mais comum antes do primeiro tool call)
+_IDLE_TOOL_PANEL = Panel(
+    _TEXT_NO_TOOL,
+    title="[AÇÃO EXECUTADA]",
+    border_style="green",
+    padding=(1, 2),
+)
+
+
+@dataclass(slots=True)
+class DashboardState:
+    """Current state of dashboard metrics."""
+    ai_reasoning: str = "Aguardando..."
+    ai_tool_decision: str = ""
+    current_tool: str = ""
+    tool_status: str = "idle"
+    tool_progress: float = 0.0
+    security_status: str = "✅ OK"
+    security_violations: int = 0
+    memory_recall_count: int = 0
+    memory_entries: int = 0
+    last_memory_recall: str = ""
+    iterations: int = 0
+    total_actions: int = 0
+    execution_time: float = 0.0
+
+
+class RichDashboard:
+    """
+    Terminal dashboard for PyOS-Agent telemetry.
+    
+    Displays 4 panels:
+    1. AI Thoughts (reasoning, decisions)
+    2. Tool Execution (current action, progress)
+    3. Security Status (validations, violations)
+    4. Memory Status (recalls, learning)
+    """
+
+    def __init__(self, width: int = 200, height: int = 30, update_interval: float = 0.5):
+        """
+        Initialize dashboard.
+        
+        Args:
+            width: Console width
+            height: Console height  
+            update_interval: Refresh rate in seconds
+        """
+        self.console = Console(width=width, height=height, force_terminal=True)
+        self.update_interval = update_interval
+        self.state = DashboardState()
+        self.is_running = False
+        self.live: Optional[Live] = None
+
+        # Layout skeleton built once; frames only mutate the leaf slots,
+        # letting Rich reuse cached measurements instead of re-measuring
+        # a fresh tree every tick.
+        self._layout = self._build_layout()
+        self._slots = {
+            "header": self._layout["header"],
+            "ai": self._layout["ai"],
+            "tool": self._layout["tool"],
+            "security": self._layout["security"],
+            "memory": self._layout["memory"],
+            "footer": self._layout["footer"],
+        }
+        self._render_map = {
+            "header": self._render_header,
+            "ai": self._render_ai_panel,
+            "tool": self._render_tool_panel,
+            "security": self._render_security_panel,
+            "memory": self._render_memory_panel,
+        }
+
+        # Dirty tracking: só re-renderiza painéis cujos inputs mudaram
+        self._dirty = dict.fromkeys(self._render_map, True)
+        self._cached_panels: dict[str, Panel] = {}
+        self._last_footer_second = -1
+        self._cached_footer_panel: Optional[Panel] = None
+
+        # Builders de texto reutilizados por painel (reset via .plain = "")
+        self._ai_text = Text()
+        self._tool_text = Text()
+        self._sec_text = Text()
+        self._mem_text = Text()
+
+    def update_ai_reasoning(self, reasoning: str) -> None:
+        """Update AI reasoning panel (no-op if the text is unchanged)."""
+        new = reasoning if len(reasoning) <= 200 else reasoning[:200]
+        if new == self.state.ai_reasoning:
+            return
+        self.state.ai_reasoning = new
+        self._dirty["ai"] = True
+
+    def update_ai_decision(self, tool: str, reasoning: str = "") -> None:
+        """Update AI tool decision."""
+        if reasoning:
+            new = reasoning if len(reasoning) <= 200 else reasoning[:200]
+            if new != self.state.ai_reasoning:
+                self.state.ai_reasoning = new
+                self._dirty["ai"] = True
+        if tool != self.state.ai_tool_decision:
+            self.state.ai_tool_decision = tool
+            self.state.current_tool = tool
+            self._dirty["ai"] = True
+            self._dirty["tool"] = True
+
+    def update_tool_status(self, tool: str, status: str, progress: float = 0.0) -> None:
+        """Update tool execution status."""
+        self.state.current_tool = tool
+        self.state.tool_status = status
+        self.state.tool_progress = progress
+        self._dirty["tool"] = True
+
+    def update_security_status(self, is_safe: bool, violations: int = 0) -> None:
+        """Update security status."""
+        if is_safe:
+            self.state.security_status = "✅ SEGURO"
+        else:
+            self.state.security_status = f"🚫 VIOLAÇÃO ({violations})"
+        self.state.security_violations = violations
+        self._dirty["security"] = True
+
+    def update_memory_recall(self, recall_count: int, total_entries: int, last_recall: str = "") -> None:
+        """Update memory recall status (no-op if nothing changed)."""
+        if last_recall:
+            recall = last_recall if len(last_recall) <= 100 else last_recall[:100]
+        else:
+            recall = ""
+        if (
+            recall_count == self.state.memory_recall_count
+            and total_entries == self.state.memory_entries
+            and recall == self.state.last_memory_recall
+        ):
+            return
+        self.state.memory_recall_count = recall_count
+        self.state.memory_entries = total_entries
+        self.state.last_memory_recall = recall
+        self._dirty["memory"] = True
+
+    def update_metrics(
+        self,
+        iterations: int,
+        total_actions: int,
+        execution_time: float,
+    ) -> None:
+        """Update general metrics."""
+        self.state.iterations = iterations
+        self.state.total_actions = total_actions
+        self.state.execution_time = execution_time
+        self._dirty["header"] = True
+
+    def _build_layout(self) -> Layout:
+        """Build dashboard layout with 4 panels."""
+        layout = Layout(name="root")
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="body"),
+            Layout(name="footer", size=2),
+        )
+
+        layout["body"].split_row(
+            Layout(name="left"),
+            Layout(name="right"),
+        )
+
+        layout["left"].split_column(
+            Layout(name="ai", size=15),
+            Layout(name="tool", size=15),
+        )
+
+        layout["right"].split_column(
+            Layout(name="security", size=15),
+            Layout(name="memory", size=15),
+        )
+
+        return layout
+
+    def _render_header(self) -> Panel:
+        """Render header panel with title and metrics."""
+        header_text = Text()
+        header_text.append("🤖 PyOS-Agent ", style="bold blue")
+        header_text.append("│ ", style="dim")
+        header_text.append(f"Iteração {self.state.iterations} ", style="yellow")
+        header_text.append("│ ", style="dim")
+        header_text.append(f"{self.state.total_actions} ações ", style="cyan")
+        header_text.append("│ ", style="dim")
+        header_text.append(f"{self.state.execution_time:.1f}s", style="green")
+
+        return Panel(
+            header_text,
+            border_style="blue",
+            padding=(0, 1),
+        )
+
+    def _render_ai_panel(self) -> Panel:
+        """Render AI thoughts panel."""
+        ai_text = self._ai_text
+        ai_text.plain = ""
+        ai_text.append_text(_TEXT_RACIOCINIO)
+        ai_text.append(self.state.ai_reasoning, _STYLE_WHITE)
+
+        if self.state.ai_tool_decision:
+            ai_text.append("\n\n")
+            ai_text.append_text(_TEXT_DECISAO_HDR)
+            ai_text.append(f"→ {self.state.ai_tool_decision}", _STYLE_BRIGHT_YELLOW)
+
+        return Panel(
+            ai_text,
+            title="[PENSAMENTO DA IA]",
+            border_style="cyan",
+            padding=(1, 2),
+        )
+
+    def _render_tool_panel(self) -> Panel:
+        """Render tool execution panel."""
+        if not self.state.current_tool:
+            # Estado ocioso (todo frame antes do primeiro tool call):
+            # painel singleton pré-construído, zero alocação
+            return _IDLE_TOOL_PANEL
+
+        tool_text = self._tool_text
+        tool_text.plain = ""
+        tool_text.append(f"Ferramenta: {self.state.current_tool}\n", _STYLE_BOLD_GREEN)
+        tool_text.append(f"Status: {self.state.tool_status}\n", _STYLE_YELLOW)
+
+        # Progress bar (lookup em vez de multiplicação de strings);
+        # a barra é quantizada em 20 células, o rótulo mostra o valor real
+        progress_pct = int(self.state.tool_progress * 100)
+        filled = min(20, max(0, progress_pct // 5))
+        tool_text.append(f"[{_PROGRESS_BARS[filled]}] {progress_pct}%", _STYLE_GREEN)
+
+        return Panel(
+            tool_text,
+            title="[AÇÃO EXECUTADA]",
+            border_style="green",
+            padding=(1, 2),
+        )
+
+    def _render_security_panel(self) -> Panel:
+        """Render security status panel."""
+        security_text = self._sec_text
+        security_text.plain = ""
+        
+        is_safe = "SEGURO" in self.state.security_status
+        status_style = _STYLE_SEC_OK if is_safe else _STYLE_SEC_VIOLATION
+        security_text.append(f"{self.state.security_status}\n", status_style)
+
+        security_text.append(f"Violações: {self.state.security_violations}\n", _STYLE_YELLOW)
+        security_text.append_text(_TEXT_SECURITY_STATIC)
+
+        return Panel(
+            security_text,
+            title="[STATUS DE SEGURANÇA]",
+            border_style=_STYLE_GREEN if is_safe else _STYLE_RED,
+            padding=(1, 2),
+        )
+
+    def _render_memory_panel(self) -> Panel:
+        """Render memory status panel."""
+        memory_text = self._mem_text
+        memory_text.plain = ""
+        
+        memory_text.append(f"Entradas: {self.state.memory_entries}\n", _STYLE_BOLD_CYAN)
+        memory_text.append(f"Recalls: {self.state.memory_recall_count}\n", _STYLE_YELLOW)
+
+        if self.state.last_memory_recall:
+            memory_text.append("\nÚltimo Recall:\n", _STYLE_DIM)
+            memory_text.append(f"→ {self.state.last_memory_recall}", _STYLE_WHITE)
+
+        return Panel(
+            memory_text,
+            title="[MEMÓRIA RECALCADA]",
+            border_style="magenta",
+            padding=(1, 2),
+        )
+
+    def _render_footer(self) -> Panel:
+        """Render footer with timestamp and status.
+
+        The panel is cached per wall-clock second: time.time() +
+        time.strftime avoid allocating a datetime object and the panel
+        is rebuilt at most once a second regardless of refresh rate.
+        """
+        sec = int(time.time())
+        if sec == self._last_footer_second and self._cached_footer_panel is not None:
+            return self._cached_footer_panel
+
+        footer_text = Text()
+        footer_text.append(f"🕐 {time.strftime('%H:%M:%S', time.localtime(sec))}", _STYLE_DIM)
+        footer_text.append(" │ ", _STYLE_DIM)
+        footer_text.append("Press Ctrl+C to stop", _STYLE_DIM)
+
+        self._last_footer_second = sec
+        self._cached_footer_panel = Panel(
+            footer_text,
+            border_style="dim",
+            padding=(0, 1),
+        )
+        return self._cached_footer_panel
+
+    def _generate_screen(self) -> Layout:
+        """Refresh panel contents in the prebuilt layout skeleton.
+
+        Only panels whose state changed since the last frame are
+        re-rendered; the footer re-renders at most once per second.
+        """
+        for key, render in self._render_map.items():
+            if self._dirty[key]:
+                self._cached_panels[key] = render()
+                self._dirty[key] = False
+                self._slots[key].update(self._cached_panels[key])
+
+        self._slots["footer"].update(self._render_footer())
+
+        return self._layout
+
+    def start(self) -> None:
+        """Start live dashboard."""
+        self.is_running = True
+        try:
+            # Live pulls frames itself via get_renderable on its own
+            # timer; callers only mutate state through update_*.
+            # screen=True usa o buffer alternativo: Rich mantém o frame
+            # anterior e emite apenas as células que mudaram
+            self.live = Live(
+                get_renderable=self._generate_screen,
+                console=self.console,
+                refresh_per_second=1 / self.update_interval,
+                auto_refresh=True,
+                screen=True,
+                transient=False,
+                redirect_stdout=False,
+                redirect_stderr=False,
+                vertical_overflow="crop",
+            )
+            self.live.start()
+            logger.info("Dashboard Rich iniciado")
+        except Exception as e:
+            logger.error(f"Erro ao iniciar dashboard: {e}")
+            self.is_running = False
+
+    def update(self) -> None:
+        """Update dashboard display.
+
+        State writes done via update_* are picked up by Live's own
+        refresh timer, so per-event calls here are a no-op; use
+        force_refresh() when an immediate flush is required.
+        """
+
+    def force_refresh(self) -> None:
+        """Flush the current state to the terminal immediately.
+
+        Fast path: when exactly one panel is dirty (the common case for
+        a single update_* call), push just that panel into its slot and
+        refresh, skipping the full _generate_screen walk.
+        """
+        if not (self.live and self.is_running):
+            return
+
+        try:
+            dirty = [key for key, flag in self._dirty.items() if flag]
+            if len(dirty) == 1:
+                key = dirty[0]
+                self._cached_panels[key] = self._render_map[key]()
+                self._dirty[key] = False
+                self._slots[key].update(self._cached_panels[key])
+            self.live.refresh()
+        except Exception as e:
+            logger.error(f"Erro ao atualizar dashboard: {e}")
+
+    def stop(self) -> None:
+        """Stop live dashboard."""
+        if self.live:
+            self.live.stop()
+        self.is_running = False
+        logger.info("Dashboard Rich parado")
+
+    def print_summary(self) -> None:
+        """Print final execution summary."""
+        if not self.is_running:
+            return
+
+        self.console.print("\n")
+        self.console.rule("[bold green]Resumo da Execução[/bold green]")
+        
+        table = Table(title="Métricas Finais")
+        table.add_column("Métrica", style=_STYLE_CYAN)
+        table.add_column("Valor", style=_STYLE_GREEN)
+
+        # Linhas montadas de uma vez; add_row em passada única
+        rows = (
+            ("Iterações", str(self.state.iterations)),
+            ("Ações Executadas", str(self.state.total_actions)),
+            ("Tempo Total", f"{self.state.execution_time:.2f}s"),
+            ("Violações de Segurança", str(self.state.security_violations)),
+            ("Memória - Entradas", str(self.state.memory_entries)),
+            ("Memória - Recalls", str(self.state.memory_recall_count)),
+        )
+        for row in rows:
+            table.add_row(*row)
+
+        self.console.print(table)
+
+
+@lru_cache(maxsize=1)
+def get_dashboard() -> RichDashboard:
+    """Get or create the global dashboard instance.
+
+    lru_cache makes the singleton thread-safe without an explicit lock:
+    after the first call, lookups happen at C level.
+    """
+    return RichDashboard()
+
+
+@asynccontextmanager
+async def dashboard_context():
+    """Async context manager for dashboard lifecycle.
+
+    Usage: ``async with dashboard_context() as dashboard:`` — stop() and
+    print_summary() run even when the body raises.
+    """
+    dashboard = get_dashboard()
+    dashboard.start()
+    try:
+        yield dashboard
+    finally:
+        dashboard.stop()
+        dashboard.print_summary()
@@ -40,11 +40,10 @@ def initialize_agent() -> tuple[SecurityShield, dict]:
             except ValueError as e:
                 logger.warning(f"Erro ao adicionar caminho: {e}")
         
-        # Adicionar comandos básicos de segurança
+        # Adicionar comandos básicos de segurança em uma única atualização
         basic_commands = ["ls", "pwd", "echo", "cat", "grep", "find"]
-        for cmd in basic_commands:
-            shield.add_allowed_command(cmd)
-        
+        shield.add_allowed_commands(basic_commands)
+
         logger.info(f"Sistema de segurança ativado com {len(basic_commands)} comandos base")
     
     config = settings.to_dict()
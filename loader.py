@@ -7,7 +7,8 @@ in the src/pyos/plugins/ directory. No manual configuration needed.
 
 import asyncio
 import importlib.util
-import inspect
+import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Type, Callable
@@ -46,8 +47,24 @@ class PluginLoader:
             plugins_dir = current_file.parent.parent / "plugins"
 
         self.plugins_dir = plugins_dir
+        # Directory scan memoized on the directory mtime so repeated
+        # load_all/reload_all calls don't re-stat every plugin file
+        self._scan_cache: Optional[tuple[int, list[str]]] = None
+        # Persistent discovery cache (à la Twisted's dropin.cache):
+        # {file path: {"mtime": int, "classes": [names]}} so unchanged
+        # files skip the inspect scan on the next cold start
+        self._cache_path = Path("./.pyos/plugin_cache.json")
+        self._discovery_cache: dict[str, dict] = self._load_discovery_cache()
+        self._cache_dirty = False
         self.loaded_plugins: dict[str, Type[BaseTool]] = {}
         self.instances: dict[str, BaseTool] = {}
+        # Metadata and category index built at registration time so the
+        # hot list/filter paths are plain lookups instead of per-call
+        # comprehensions over every tool attribute
+        self._meta_cache: list[dict[str, str]] = []
+        self._by_category: dict[str, dict[str, BaseTool]] = {}
+        # Serializes registry writes when plugins load concurrently
+        self._registry_lock = asyncio.Lock()
         self.on_plugin_loaded: Optional[Callable[[BaseTool], None]] = None
 
         logger.info(f"PluginLoader initialized for {self.plugins_dir}")
@@ -59,29 +76,67 @@ class PluginLoader:
         Returns:
             List of Python files (excluding __init__.py and base.py)
         """
-        if not self.plugins_dir.exists():
+        try:
+            dir_mtime = os.stat(self.plugins_dir).st_mtime_ns
+        except OSError:
             logger.warning(f"Plugins directory not found: {self.plugins_dir}")
             return []
 
-        plugin_files = [
-            f.stem
-            for f in self.plugins_dir.glob("*.py")
-            if f.name not in ("__init__.py", "base.py")
-        ]
-
+        if self._scan_cache is not None and self._scan_cache[0] == dir_mtime:
+            return self._scan_cache[1]
+
+        # os.scandir yields file type from the directory entry itself,
+        # avoiding the extra stat-per-file that Path.glob incurs
+        with os.scandir(self.plugins_dir) as entries:
+            plugin_files = [
+                entry.name[:-3]
+                for entry in entries
+                if entry.is_file()
+                and entry.name.endswith(".py")
+                and entry.name not in ("__init__.py", "base.py")
+            ]
+
+        self._scan_cache = (dir_mtime, plugin_files)
         logger.debug(f"Found {len(plugin_files)} potential plugin files: {plugin_files}")
         return plugin_files
 
-    def _load_module_from_path(self, file_path: Path) -> Optional[object]:
+    def _load_discovery_cache(self) -> dict[str, dict]:
+        """Read the on-disk discovery cache, tolerating a missing/corrupt file."""
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_discovery_cache(self) -> None:
+        """Atomically persist the discovery cache for the next cold start."""
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._discovery_cache, f)
+            os.replace(tmp_path, self._cache_path)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.debug(f"Could not persist plugin cache: {e}")
+
+    async def _load_module_from_path(self, file_path: Path) -> Optional[object]:
         """
         Load a Python module from file path.
-        
+
+        The blocking spec/exec work runs in a worker thread so the event
+        loop stays free while several plugins import in parallel.
+
         Args:
             file_path: Path to Python file
-            
+
         Returns:
             Imported module or None if loading failed
         """
+        return await asyncio.to_thread(self._sync_load_module, file_path)
+
+    def _sync_load_module(self, file_path: Path) -> Optional[object]:
+        """Synchronous module import used by `_load_module_from_path`."""
         try:
             spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
             if spec is None or spec.loader is None:
@@ -110,15 +165,17 @@ class PluginLoader:
         if BaseTool is None:
             return []
 
+        # vars() walks the module __dict__ directly; inspect.getmembers
+        # would sort dir() and trigger descriptors for every attribute
         tool_classes = []
-        for name, obj in inspect.getmembers(module):
+        for name, obj in vars(module).items():
             # Skip BaseTool itself and private classes
             if name.startswith("_"):
                 continue
 
             # Check if it's a class and inherits from BaseTool
             if (
-                inspect.isclass(obj)
+                isinstance(obj, type)
                 and issubclass(obj, BaseTool)
                 and obj is not BaseTool
             ):
@@ -136,9 +193,18 @@ class PluginLoader:
         plugin_files = self.scan_plugins()
         logger.info(f"Loading {len(plugin_files)} plugins...")
 
-        for plugin_name in plugin_files:
-            plugin_path = self.plugins_dir / f"{plugin_name}.py"
-            await self.load_plugin_from_file(plugin_path)
+        # Fan out: module imports run in threads, so N plugins load in
+        # parallel while error isolation stays per-file
+        await asyncio.gather(
+            *(
+                self.load_plugin_from_file(self.plugins_dir / f"{plugin_name}.py")
+                for plugin_name in plugin_files
+            ),
+            return_exceptions=True,
+        )
+
+        if self._cache_dirty:
+            self._save_discovery_cache()
 
         logger.info(f"✅ Loaded {len(self.instances)} tool(s)")
         return self.instances
@@ -155,11 +221,33 @@ class PluginLoader:
         """
         logger.debug(f"Loading plugin file: {file_path}")
 
-        module = self._load_module_from_path(file_path)
+        module = await self._load_module_from_path(file_path)
         if module is None:
             return []
 
-        tool_classes = self._find_tool_classes(module)
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = self._discovery_cache.get(str(file_path))
+        if cached and mtime_ns is not None and cached.get("mtime") == mtime_ns:
+            # Source unchanged since the cache was written: resolve the
+            # remembered class names directly instead of re-scanning
+            tool_classes = [
+                getattr(module, name)
+                for name in cached.get("classes", [])
+                if hasattr(module, name)
+            ]
+        else:
+            tool_classes = self._find_tool_classes(module)
+            if mtime_ns is not None:
+                self._discovery_cache[str(file_path)] = {
+                    "mtime": mtime_ns,
+                    "classes": [cls.__name__ for cls in tool_classes],
+                }
+                self._cache_dirty = True
+
         if not tool_classes:
             logger.debug(f"No tools found in {file_path}")
             return []
@@ -169,8 +257,19 @@ class PluginLoader:
             try:
                 # Instantiate the tool
                 tool_instance = tool_class()
-                self.loaded_plugins[tool_instance.name] = tool_class
-                self.instances[tool_instance.name] = tool_instance
+                async with self._registry_lock:
+                    self.loaded_plugins[tool_instance.name] = tool_class
+                    self.instances[tool_instance.name] = tool_instance
+                    self._meta_cache.append({
+                        "name": tool_instance.name,
+                        "description": tool_instance.description,
+                        "category": tool_instance.category,
+                        "version": tool_instance.version,
+                        "requires_approval": tool_instance.requires_approval,
+                    })
+                    self._by_category.setdefault(
+                        tool_instance.category, {}
+                    )[tool_instance.name] = tool_instance
 
                 logger.info(f"  ✓ Loaded {tool_instance.name} ({tool_instance.category})")
 
@@ -206,16 +305,7 @@ class PluginLoader:
         Returns:
             List of tool info dicts
         """
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "category": tool.category,
-                "version": tool.version,
-                "requires_approval": tool.requires_approval,
-            }
-            for tool in self.instances.values()
-        ]
+        return self._meta_cache
 
     def filter_tools(self, category: Optional[str] = None) -> dict[str, BaseTool]:
         """
@@ -230,19 +320,20 @@ class PluginLoader:
         if category is None:
             return self.instances
 
-        return {
-            name: tool
-            for name, tool in self.instances.items()
-            if tool.category == category
-        }
+        return self._by_category.get(category, {})
 
     async def reload_all(self) -> None:
         """Reload all plugins (useful for development)."""
         logger.info("Reloading all plugins...")
         previous_count = len(self.instances)
 
+        self._scan_cache = None
+        self._discovery_cache.clear()
+        self._cache_dirty = True
         self.loaded_plugins.clear()
         self.instances.clear()
+        self._meta_cache.clear()
+        self._by_category.clear()
 
         await self.load_all()
         logger.info(f"Reload complete: {previous_count} → {len(self.instances)} tools")
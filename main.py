@@ -1,54 +1,98 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from pydantic import BaseModel
-from typing import Any, Optional
-import uvicorn
-
-from pyos.core.config import get_settings
-from pyos.core.orchestrator import PyOSOrchestrator
-
-app = FastAPI(
-    title="PyOS-Agent API",
-    description="Interface para controle do agente autônomo PyOS",
-    version="0.1.0"
-)
-
-settings = get_settings()
-orchestrator = PyOSOrchestrator(settings=settings)
-
-class ObjectiveRequest(BaseModel):
-    objective: str
-
-class ObjectiveResponse(BaseModel):
-    success: bool
-    message: str
-    data: Optional[dict[str, Any]] = None
-
-@app.get("/")
-async def root():
-    return {
-        "app": settings.app_name,
-        "version": settings.app_version,
-        "status": "online"
-    }
-
-@app.get("/config")
-async def get_config():
-    return settings.to_dict()
-
-@app.post("/execute", response_model=ObjectiveResponse)
-async def execute_objective(request: ObjectiveRequest):
-    try:
-        result = await orchestrator.execute_objective(request.objective)
-        return ObjectiveResponse(
-            success=result.get("success", False),
-            message="Objetivo processado",
-            data=result
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-def start_api():
-    uvicorn.run(app, host=settings.api_host, port=settings.api_port)
-
-if __name__ == "__main__":
-    start_api()
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Request
+from pydantic import BaseModel
+from typing import Any, Optional
+import uvicorn
+
+from pyos.core.config import get_settings
+from pyos.core.orchestrator import PyOSOrchestrator
+
+
+def _install_child_watcher() -> None:
+    """
+    Instala o PidfdChildWatcher no Linux (kernel ≥ 5.3).
+
+    O término de subprocessos vira um evento de prontidão do pidfd em
+    vez do tick de polling do watcher padrão — comandos curtos são
+    colhidos em sub-milissegundo. No-op em outras plataformas e em
+    versões do Python que removeram a API de child watchers.
+    """
+    if not (sys.platform.startswith("linux") and hasattr(asyncio, "PidfdChildWatcher")):
+        return
+    try:
+        watcher = asyncio.PidfdChildWatcher()
+        asyncio.get_event_loop_policy().set_child_watcher(watcher)
+    except (NotImplementedError, RuntimeError):
+        # pidfd_open ausente (kernel antigo) ou política sem suporte
+        pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _install_child_watcher()
+    # Construir o orquestrador aqui (e não no import do módulo) evita que
+    # o carregamento do ChromaDB + modelo de embeddings bloqueie o
+    # bootstrap do uvicorn; to_thread mantém o event loop livre.
+    app.state.orchestrator = await asyncio.to_thread(
+        PyOSOrchestrator, settings=get_settings()
+    )
+    yield
+
+
+app = FastAPI(
+    title="PyOS-Agent API",
+    description="Interface para controle do agente autônomo PyOS",
+    version="0.1.0",
+    lifespan=lifespan,
+)
+
+
+def get_orchestrator(request: Request) -> PyOSOrchestrator:
+    """Injeta o orquestrador singleton criado no lifespan."""
+    return request.app.state.orchestrator
+
+
+class ObjectiveRequest(BaseModel):
+    objective: str
+
+class ObjectiveResponse(BaseModel):
+    success: bool
+    message: str
+    data: Optional[dict[str, Any]] = None
+
+@app.get("/")
+async def root():
+    settings = get_settings()
+    return {
+        "app": settings.app_name,
+        "version": settings.app_version,
+        "status": "online"
+    }
+
+@app.get("/config")
+async def get_config():
+    return get_settings().to_dict()
+
+@app.post("/execute", response_model=ObjectiveResponse)
+async def execute_objective(
+    request: ObjectiveRequest,
+    orchestrator: PyOSOrchestrator = Depends(get_orchestrator),
+):
+    try:
+        result = await orchestrator.execute_objective(request.objective)
+        return ObjectiveResponse(
+            success=result.get("success", False),
+            message="Objetivo processado",
+            data=result
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def start_api():
+    settings = get_settings()
+    uvicorn.run(app, host=settings.api_host, port=settings.api_port)
+
+if __name__ == "__main__":
+    start_api()
@@ -1,425 +1,800 @@
-"""
-Semantic Memory with ChromaDB and Vector Embeddings.
-
-This module implements a persistent semantic memory system that allows
-the agent to learn from past actions, recall similar experiences, and
-improve decision-making through contextual similarity search.
-
-Architecture:
-    - ChromaDB for persistent vector storage
-    - sentence-transformers for semantic embeddings
-    - Semantic Recall: agent queries historical actions before acting
-    - Learning Loop: successful actions improve future decisions
-"""
-
-import asyncio
-import hashlib
-import json
-from datetime import datetime
-from typing import Any, Callable, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
-
-try:
-    import chromadb
-    from chromadb.config import Settings as ChromaSettings
-except ImportError:
-    chromadb = None
-
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    SentenceTransformer = None
-
-from loguru import logger
-
-
-class MemoryType(str, Enum):
-    """Types of memory entries."""
-    ACTION = "action"
-    ERROR = "error"
-    SUCCESS = "success"
-    DECISION = "decision"
-    OBSERVATION = "observation"
-
-
-@dataclass
-class MemoryEntry:
-    """A single memory entry with semantic meaning."""
-    id: str
-    type: MemoryType
-    content: str
-    metadata: dict[str, Any]
-    timestamp: str
-    embedding: Optional[list[float]] = None
-    success: bool = True
-    error_message: Optional[str] = None
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage."""
-        data = asdict(self)
-        data['type'] = self.type.value
-        return data
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "MemoryEntry":
-        """Create from dictionary."""
-        data['type'] = MemoryType(data['type'])
-        return cls(**data)
-
-
-class SemanticMemory:
-    """
-    Semantic memory system using ChromaDB and sentence-transformers.
-    
-    Provides:
-    - Persistent vector storage of actions and memories
-    - Semantic similarity search (find similar past actions)
-    - Learning from successes and failures
-    - Context-aware decision support
-    """
-
-    def __init__(
-        self,
-        db_path: str = "./.pyos/memory",
-        model_name: str = "all-MiniLM-L6-v2",
-        collection_name: str = "agent_memory",
-    ):
-        """
-        Initialize semantic memory.
-        
-        Args:
-            db_path: Path to ChromaDB persistence
-            model_name: Sentence-transformer model for embeddings
-            collection_name: ChromaDB collection name
-        """
-        if chromadb is None:
-            logger.warning("ChromaDB not installed. Memory disabled.")
-            self.enabled = False
-            return
-
-        self.enabled = True
-        self.db_path = db_path
-        self.model_name = model_name
-        self.collection_name = collection_name
-
-        # Initialize ChromaDB
-        logger.info(f"Initializing SemanticMemory at {db_path}")
-        try:
-            self.client = chromadb.PersistentClient(
-                path=db_path,
-                settings=ChromaSettings(
-                    anonymized_telemetry=False,
-                    allow_reset=True,
-                )
-            )
-            self.collection = self.client.get_or_create_collection(
-                name=collection_name,
-                metadata={"hnsw:space": "cosine"}
-            )
-        except Exception as e:
-            logger.error(f"Failed to initialize ChromaDB: {e}")
-            self.enabled = False
-            return
-
-        # Initialize embeddings model
-        if SentenceTransformer is None:
-            logger.warning("sentence-transformers not installed. Using dummy embeddings.")
-            self.embedder: Optional[SentenceTransformer] = None
-        else:
-            try:
-                logger.info(f"Loading embeddings model: {model_name}")
-                self.embedder = SentenceTransformer(model_name)
-            except Exception as e:
-                logger.error(f"Failed to load embeddings model: {e}")
-                self.embedder = None
-
-        self.entry_count = 0
-        logger.info(f"SemanticMemory initialized with {self._count_entries()} existing entries")
-
-    def _count_entries(self) -> int:
-        """Count total entries in memory."""
-        if not self.enabled:
-            return 0
-        try:
-            return self.collection.count()
-        except Exception:
-            return 0
-
-    def _embed(self, text: str) -> Optional[list[float]]:
-        """Generate embedding for text."""
-        if not self.embedder:
-            # Return dummy embedding if model not available
-            return [0.0] * 384
-
-        try:
-            embedding = self.embedder.encode(text)
-            return embedding.tolist()
-        except Exception as e:
-            logger.error(f"Embedding failed: {e}")
-            return None
-
-    def _generate_id(self, content: str, timestamp: str) -> str:
-        """Generate unique ID for memory entry."""
-        combined = f"{content}{timestamp}"
-        return hashlib.md5(combined.encode()).hexdigest()[:12]
-
-    async def store(
-        self,
-        content: str,
-        memory_type: MemoryType = MemoryType.ACTION,
-        metadata: Optional[dict[str, Any]] = None,
-        success: bool = True,
-        error_message: Optional[str] = None,
-    ) -> MemoryEntry:
-        """
-        Store a memory entry.
-        
-        Args:
-            content: The memory content (action, decision, observation)
-            memory_type: Type of memory
-            metadata: Additional context metadata
-            success: Whether the action/decision succeeded
-            error_message: Error details if failed
-            
-        Returns:
-            Created MemoryEntry
-        """
-        if not self.enabled:
-            return MemoryEntry(
-                id="disabled",
-                type=memory_type,
-                content=content,
-                metadata=metadata or {},
-                timestamp=datetime.now().isoformat(),
-            )
-
-        timestamp = datetime.now().isoformat()
-        entry_id = self._generate_id(content, timestamp)
-        embedding = self._embed(content)
-
-        entry = MemoryEntry(
-            id=entry_id,
-            type=memory_type,
-            content=content,
-            metadata=metadata or {},
-            timestamp=timestamp,
-            embedding=embedding,
-            success=success,
-            error_message=error_message,
-        )
-
-        try:
-            self.collection.add(
-                ids=[entry_id],
-                documents=[content],
-                embeddings=[embedding] if embedding else None,
-                metadatas=[{
-                    "type": memory_type.value,
-                    "success": success,
-                    "error": error_message or "",
-                    "timestamp": timestamp,
-                    **metadata
-                }]
-            )
-            self.entry_count += 1
-            logger.debug(f"Memory stored: {entry_id} ({memory_type.value})")
-        except Exception as e:
-            logger.error(f"Failed to store memory: {e}")
-
-        return entry
-
-    async def recall(
-        self,
-        query: str,
-        limit: int = 5,
-        memory_type: Optional[MemoryType] = None,
-        success_only: bool = False,
-    ) -> list[MemoryEntry]:
-        """
-        Recall similar memories using semantic search.
-        
-        Args:
-            query: Semantic query (similar to past memories)
-            limit: Max results to return
-            memory_type: Filter by memory type
-            success_only: Only return successful actions
-            
-        Returns:
-            List of similar MemoryEntry objects, ordered by relevance
-        """
-        if not self.enabled:
-            return []
-
-        embedding = self._embed(query)
-        if not embedding:
-            return []
-
-        try:
-            # Build where filter if needed
-            where_filter = None
-            if memory_type or success_only:
-                filters = []
-                if memory_type:
-                    filters.append({"type": {"$eq": memory_type.value}})
-                if success_only:
-                    filters.append({"success": {"$eq": True}})
-                
-                where_filter = {"$and": filters} if len(filters) > 1 else filters[0]
-
-            results = self.collection.query(
-                query_embeddings=[embedding],
-                n_results=limit,
-                where=where_filter,
-                include=["documents", "metadatas", "distances"]
-            )
-
-            memories = []
-            if results and results["ids"] and len(results["ids"]) > 0:
-                for i, entry_id in enumerate(results["ids"][0]):
-                    metadata = results["metadatas"][0][i]
-                    document = results["documents"][0][i]
-
-                    memory = MemoryEntry(
-                        id=entry_id,
-                        type=MemoryType(metadata.get("type", "action")),
-                        content=document,
-                        metadata={k: v for k, v in metadata.items() if k not in ["type", "success", "error", "timestamp"]},
-                        timestamp=metadata.get("timestamp", datetime.now().isoformat()),
-                        success=metadata.get("success", True),
-                        error_message=metadata.get("error"),
-                    )
-                    memories.append(memory)
-
-            logger.debug(f"Recalled {len(memories)} memories for query: {query[:50]}...")
-            return memories
-
-        except Exception as e:
-            logger.error(f"Recall failed: {e}")
-            return []
-
-    async def learn_from_success(
-        self,
-        action: str,
-        result: str,
-        tool: str,
-        context: Optional[dict[str, Any]] = None,
-    ) -> None:
-        """
-        Store a successful action for future learning.
-        
-        Args:
-            action: The action that succeeded
-            result: The result/outcome
-            tool: Tool that was used
-            context: Additional context
-        """
-        metadata = {"tool": tool, "result": result, **(context or {})}
-        await self.store(
-            content=f"{action} → {result}",
-            memory_type=MemoryType.SUCCESS,
-            metadata=metadata,
-            success=True,
-        )
-
-    async def learn_from_error(
-        self,
-        action: str,
-        error: str,
-        tool: str,
-        attempted_fixes: Optional[list[str]] = None,
-    ) -> None:
-        """
-        Store a failed action for learning and recovery.
-        
-        Args:
-            action: The action that failed
-            error: Error message
-            tool: Tool that failed
-            attempted_fixes: Fixes that were already tried
-        """
-        metadata = {
-            "tool": tool,
-            "attempted_fixes": attempted_fixes or [],
-        }
-        await self.store(
-            content=f"ERROR: {action} failed",
-            memory_type=MemoryType.ERROR,
-            metadata=metadata,
-            success=False,
-            error_message=error,
-        )
-
-    async def get_similar_successes(self, action: str, limit: int = 3) -> list[MemoryEntry]:
-        """Get successful past actions similar to the given action."""
-        return await self.recall(
-            query=action,
-            limit=limit,
-            memory_type=MemoryType.SUCCESS,
-            success_only=True,
-        )
-
-    async def get_similar_errors(self, action: str, limit: int = 3) -> list[MemoryEntry]:
-        """Get failed past actions similar to the given action."""
-        return await self.recall(
-            query=action,
-            limit=limit,
-            memory_type=MemoryType.ERROR,
-            success_only=False,
-        )
-
-    def clear_memory(self) -> None:
-        """Clear all memory entries. Use with caution!"""
-        if not self.enabled:
-            return
-        
-        try:
-            self.client.delete_collection(name=self.collection_name)
-            self.collection = self.client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"hnsw:space": "cosine"}
-            )
-            self.entry_count = 0
-            logger.warning("Memory cleared!")
-        except Exception as e:
-            logger.error(f"Failed to clear memory: {e}")
-
-    def export_memory(self, path: str) -> None:
-        """Export all memories to JSON file."""
-        if not self.enabled:
-            return
-
-        try:
-            all_entries = self.collection.get(include=["documents", "metadatas"])
-            export_data = {
-                "exported_at": datetime.now().isoformat(),
-                "total_entries": len(all_entries["ids"]),
-                "entries": []
-            }
-
-            for i, entry_id in enumerate(all_entries["ids"]):
-                export_data["entries"].append({
-                    "id": entry_id,
-                    "document": all_entries["documents"][i],
-                    "metadata": all_entries["metadatas"][i],
-                })
-
-            with open(path, "w") as f:
-                json.dump(export_data, f, indent=2)
-            
-            logger.info(f"Memory exported to {path}")
-        except Exception as e:
-            logger.error(f"Export failed: {e}")
-
-    def stats(self) -> dict[str, Any]:
-        """Get memory statistics."""
-        if not self.enabled:
-            return {"enabled": False}
-
-        return {
-            "enabled": True,
-            "total_entries": self._count_entries(),
-            "collection": self.collection_name,
-            "model": self.model_name,
-            "db_path": self.db_path,
-        }
+"""
+Semantic Memory with ChromaDB and Vector Embeddings.
+
+This module implements a persistent semantic memory system that allows
+the agent to learn from past actions, recall similar experiences, and
+improve decision-making through contextual similarity search.
+
+Architecture:
+    - ChromaDB for persistent vector storage
+    - sentence-transformers for semantic embeddings
+    - Semantic Recall: agent queries historical actions before acting
+    - Learning Loop: successful actions improve future decisions
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+from dataclasses import dataclass
+from enum import Enum
+
+try:
+    import chromadb
+    from chromadb.config import Settings as ChromaSettings
+except ImportError:
+    chromadb = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+except ImportError:
+    ort = None
+
+from loguru import logger
+
+
+# Page size for paginated collection reads during export
+_EXPORT_PAGE = 2048
+
+# Hoisted so recall() doesn't rebuild the include list on every call
+_RECALL_INCLUDE = ["documents", "metadatas", "distances"]
+
+_last_iso: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current ISO timestamp from a single clock read.
+
+    The formatted string is memoized per millisecond, so batched stores
+    pay for one datetime construction instead of one per entry.
+    """
+    global _last_iso
+    ns = time.time_ns()
+    ms = ns // 1_000_000
+    if ms != _last_iso[0]:
+        _last_iso = (ms, datetime.fromtimestamp(ns / 1e9).isoformat())
+    return _last_iso[1]
+
+
+class MemoryType(str, Enum):
+    """Types of memory entries."""
+    ACTION = "action"
+    ERROR = "error"
+    SUCCESS = "success"
+    DECISION = "decision"
+    OBSERVATION = "observation"
+
+
+@dataclass(slots=True)
+class MemoryEntry:
+    """A single memory entry with semantic meaning."""
+    id: str
+    type: MemoryType
+    content: str
+    metadata: dict[str, Any]
+    timestamp: str
+    # float16 numpy row when numpy is available, else a plain float list
+    embedding: Optional[Any] = None
+    success: bool = True
+    error_message: Optional[str] = None
+
+    def to_dict(self, include_embedding: bool = False) -> dict[str, Any]:
+        """
+        Convert to dictionary for storage.
+
+        A literal dict is ~10x cheaper than `dataclasses.asdict`, which
+        deep-copies every field — including the 384-float embedding. The
+        embedding is only included when explicitly requested.
+        """
+        data = {
+            "id": self.id,
+            "type": self.type.value,
+            "content": self.content,
+            "metadata": self.metadata,
+            "timestamp": self.timestamp,
+            "success": self.success,
+            "error_message": self.error_message,
+        }
+        if include_embedding:
+            data["embedding"] = self.embedding
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MemoryEntry":
+        """Create from dictionary."""
+        data['type'] = MemoryType(data['type'])
+        return cls(**data)
+
+
+class SemanticMemory:
+    """
+    Semantic memory system using ChromaDB and sentence-transformers.
+    
+    Provides:
+    - Persistent vector storage of actions and memories
+    - Semantic similarity search (find similar past actions)
+    - Learning from successes and failures
+    - Context-aware decision support
+    """
+
+    def __init__(
+        self,
+        db_path: str = "./.pyos/memory",
+        model_name: str = "all-MiniLM-L6-v2",
+        collection_name: str = "agent_memory",
+    ):
+        """
+        Initialize semantic memory.
+        
+        Args:
+            db_path: Path to ChromaDB persistence
+            model_name: Sentence-transformer model for embeddings
+            collection_name: ChromaDB collection name
+        """
+        if chromadb is None:
+            logger.warning("ChromaDB not installed. Memory disabled.")
+            self.enabled = False
+            return
+
+        self.enabled = True
+        self.db_path = db_path
+        self.model_name = model_name
+        self.collection_name = collection_name
+
+        # Lazy initialization: the ~90MB embeddings model and the HNSW
+        # index are only loaded on the first store/recall, keeping
+        # cold-start cheap for processes that never touch memory.
+        self.client = None
+        self.collection = None
+        self.session = None
+        self.tokenizer = None
+        self.embedder: Optional[SentenceTransformer] = None
+        self._ready = False
+        self._init_lock = asyncio.Lock()
+
+        # Write-path batching: concurrent store() calls are buffered for a
+        # short window and flushed together so the embedding model runs one
+        # batched encode() and ChromaDB receives a single add() per batch.
+        self._max_batch = 32
+        self._max_delay = 0.01  # seconds to wait for more entries to join
+        self._pending: list[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Content-hash dedupe: storing identical content twice (e.g. the
+        # same learn_from_success during a retry loop) returns the
+        # original entry instead of re-embedding and re-adding it.
+        self._dedupe_cache: OrderedDict[str, MemoryEntry] = OrderedDict()
+        self._dedupe_cache_max = 10_000
+
+        # Read-path memoization: agents re-ask identical queries during
+        # retry/planning loops. Every write bumps _version, which is part
+        # of the cache key, so stale results can never be served.
+        self._recall_cache: OrderedDict[tuple, list["MemoryEntry"]] = OrderedDict()
+        self._recall_cache_max = 128
+        self._version = 0
+
+        # Every (memory_type, success_only) filter combination built once
+        # so recall() just indexes instead of allocating dicts per call
+        self._where_filters: dict[tuple, Optional[dict]] = {
+            (None, False): None,
+            (None, True): {"success": {"$eq": True}},
+        }
+        for mt in MemoryType:
+            self._where_filters[(mt, False)] = {"type": {"$eq": mt.value}}
+            self._where_filters[(mt, True)] = {"$and": [
+                {"type": {"$eq": mt.value}},
+                {"success": {"$eq": True}},
+            ]}
+
+        self.entry_count = 0
+        logger.info(f"SemanticMemory configured for {db_path} (deferred init)")
+
+    async def _ensure_ready(self) -> None:
+        """Initialize ChromaDB and the embedder on first use."""
+        if not self.enabled or self._ready:
+            return
+
+        async with self._init_lock:
+            if self._ready or not self.enabled:
+                return
+            await asyncio.to_thread(self._initialize)
+
+    def _initialize(self) -> None:
+        """Synchronous heavy initialization, run once off the event loop."""
+        logger.info(f"Initializing SemanticMemory at {self.db_path}")
+        try:
+            self.client = chromadb.PersistentClient(
+                path=self.db_path,
+                settings=ChromaSettings(
+                    anonymized_telemetry=False,
+                    allow_reset=True,
+                )
+            )
+            self.collection = self.client.get_or_create_collection(
+                name=self.collection_name,
+                metadata={"hnsw:space": "cosine"}
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize ChromaDB: {e}")
+            self.enabled = False
+            return
+
+        # Embeddings model: prefer an int8-quantized ONNX session (half
+        # the memory bandwidth, VNNI matmuls on modern CPUs); fall back
+        # to the FP32 SentenceTransformer.
+        if not self._init_onnx_embedder():
+            if SentenceTransformer is None:
+                logger.warning("sentence-transformers not installed. Using dummy embeddings.")
+            else:
+                try:
+                    logger.info(f"Loading embeddings model: {self.model_name}")
+                    self.embedder = SentenceTransformer(self.model_name)
+                    if torch is not None:
+                        # Let batched encode() GEMMs use every core
+                        torch.set_num_threads(os.cpu_count() or 1)
+                except Exception as e:
+                    logger.error(f"Failed to load embeddings model: {e}")
+                    self.embedder = None
+
+        self._ready = True
+        logger.info(f"SemanticMemory initialized with {self._count_entries()} existing entries")
+
+    def _count_entries(self) -> int:
+        """Count total entries in memory (0 when not yet initialized)."""
+        if not self.enabled or self.collection is None:
+            return 0
+        try:
+            return self.collection.count()
+        except Exception:
+            return 0
+
+    def _init_onnx_embedder(self) -> bool:
+        """
+        Try to load an int8-quantized ONNX copy of the embeddings model.
+
+        The exported model is cached under the ChromaDB directory so the
+        one-time export + dynamic quantization never runs twice.
+        """
+        if ort is None or np is None:
+            return False
+
+        onnx_dir = Path(self.db_path) / "minilm-int8"
+        model_path = onnx_dir / "model_quantized.onnx"
+        try:
+            if not model_path.exists():
+                logger.info(f"Exporting int8 ONNX embeddings model to {onnx_dir}")
+                exported = ORTModelForFeatureExtraction.from_pretrained(
+                    self.model_name, export=True
+                )
+                exported.save_pretrained(onnx_dir)
+                quantizer = ORTQuantizer.from_pretrained(onnx_dir)
+                quantizer.quantize(
+                    save_dir=onnx_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+                )
+
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = os.cpu_count() or 1
+            self.session = ort.InferenceSession(
+                str(model_path),
+                sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+            logger.info("Using int8 ONNX embeddings model")
+            return True
+        except Exception as e:
+            logger.warning(f"ONNX embedder unavailable, using SentenceTransformer: {e}")
+            self.session = None
+            self.tokenizer = None
+            return False
+
+    def _onnx_encode(self, texts: list[str]) -> "np.ndarray":
+        """Tokenize, run the ONNX session, mean-pool and L2-normalize."""
+        tokens = self.tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        input_names = {node.name for node in self.session.get_inputs()}
+        hidden = self.session.run(
+            None, {k: v for k, v in tokens.items() if k in input_names}
+        )[0]
+        mask = tokens["attention_mask"][..., None].astype(hidden.dtype)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return pooled / np.linalg.norm(pooled, axis=1, keepdims=True)
+
+    def _embed(self, text: str) -> Optional[Any]:
+        """
+        Generate embedding for text.
+
+        Returns the raw float32 numpy row — ChromaDB re-boxes Python
+        float lists into numpy anyway, so converting via ``.tolist()``
+        would only allocate 384 Python floats per call for nothing.
+        """
+        try:
+            if self.session is not None:
+                return self._onnx_encode([text])[0]
+            if self.embedder:
+                return self.embedder.encode(text, convert_to_numpy=True)
+        except Exception as e:
+            logger.error(f"Embedding failed: {e}")
+            return None
+
+        # Return dummy embedding if no model is available
+        return [0.0] * 384
+
+    def _embed_batch(self, texts: list[str]) -> list[Optional[Any]]:
+        """
+        Generate embeddings for many texts in a single forward pass.
+
+        Rows are kept as float16 — cosine similarity is unaffected at
+        MiniLM precision and every cached entry shrinks 12x versus a
+        Python float list. They are upcast to float32 only at the
+        ChromaDB boundary.
+        """
+        try:
+            if self.session is not None:
+                return list(self._onnx_encode(texts).astype(np.float16))
+            if self.embedder:
+                embeddings = self.embedder.encode(texts, batch_size=32, convert_to_numpy=True)
+                return list(embeddings.astype(np.float16)) if np is not None else list(embeddings)
+        except Exception as e:
+            logger.error(f"Batch embedding failed: {e}")
+            return [None] * len(texts)
+
+        return [[0.0] * 384 for _ in texts]
+
+    def _content_hash(self, content: str) -> str:
+        """Short content fingerprint used for store deduplication."""
+        if blake3 is not None:
+            return blake3(content.encode()).hexdigest(length=8)
+        return hashlib.md5(content.encode()).hexdigest()[:16]
+
+    def _generate_id(self, content: str, timestamp: str) -> str:
+        """Generate unique ID for memory entry."""
+        if blake3 is not None:
+            # SIMD-accelerated and several times faster than MD5; feeding
+            # the parts separately avoids the intermediate concat string.
+            hasher = blake3()
+            hasher.update(content.encode())
+            hasher.update(timestamp.encode())
+            return hasher.hexdigest(length=6)  # 12 hex chars
+
+        combined = f"{content}{timestamp}"
+        return hashlib.md5(combined.encode()).hexdigest()[:12]
+
+    async def store(
+        self,
+        content: str,
+        memory_type: MemoryType = MemoryType.ACTION,
+        metadata: Optional[dict[str, Any]] = None,
+        success: bool = True,
+        error_message: Optional[str] = None,
+    ) -> MemoryEntry:
+        """
+        Store a memory entry.
+        
+        Args:
+            content: The memory content (action, decision, observation)
+            memory_type: Type of memory
+            metadata: Additional context metadata
+            success: Whether the action/decision succeeded
+            error_message: Error details if failed
+            
+        Returns:
+            Created MemoryEntry
+        """
+        await self._ensure_ready()
+        if not self.enabled:
+            return MemoryEntry(
+                id="disabled",
+                type=memory_type,
+                content=content,
+                metadata=metadata or {},
+                timestamp=_now_iso(),
+            )
+
+        content_hash = self._content_hash(content)
+        duplicate = self._dedupe_cache.get(content_hash)
+        if duplicate is not None:
+            self._dedupe_cache.move_to_end(content_hash)
+            logger.debug(f"Memory store skipped: duplicate content {content_hash}")
+            return duplicate
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append(
+            (content, memory_type, metadata or {}, success, error_message, content_hash, future)
+        )
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+
+        return await future
+
+    async def embed_batch(self, texts: list[str]) -> list[Optional[Any]]:
+        """
+        Embed many texts in one batched forward pass, off the event loop.
+
+        Public helper for callers (e.g. the orchestrator) that want to
+        amortize model overhead over several queries at once.
+        """
+        if not texts:
+            return []
+        await self._ensure_ready()
+        if not self.enabled:
+            return [None] * len(texts)
+        return await asyncio.to_thread(self._embed_batch, texts)
+
+    async def flush(self) -> None:
+        """
+        Block until every buffered store has been persisted.
+
+        Call this before shutdown; recall() also uses it so reads always
+        observe writes that were issued earlier.
+        """
+        if not self.enabled:
+            return
+        while self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+
+    async def _flush_pending(self) -> None:
+        """Drain pending stores in batches of up to ``_max_batch`` entries."""
+        while self._pending:
+            if len(self._pending) < self._max_batch:
+                # Short window so concurrent stores can join the same batch
+                await asyncio.sleep(self._max_delay)
+            batch = self._pending[:self._max_batch]
+            del self._pending[:len(batch)]
+            # Embedding + HNSW insert are blocking; run the whole flush
+            # off-loop so concurrent coroutines keep making progress
+            try:
+                entries = await asyncio.to_thread(self._store_batch, batch)
+            except Exception as exc:
+                # Embedding or persistence failed: fail every waiter in
+                # the batch instead of leaving store() awaiting forever
+                # (or pretending unpersisted data was stored)
+                logger.error(f"Failed to store memory batch: {exc}")
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            # Futures must be resolved here, on the loop thread:
+            # asyncio.Future is not thread-safe, so set_result from the
+            # worker would race the loop (and raise under debug mode)
+            for (*_, future), entry in zip(batch, entries):
+                if not future.done():
+                    future.set_result(entry)
+
+    def _store_batch(self, batch: list[tuple]) -> list[MemoryEntry]:
+        """
+        Embed and persist a batch of pending entries with one add() call.
+
+        Returns one entry per batch item; identical content within the
+        batch shares the first occurrence's entry. Raises on embedding
+        or persistence failure so the caller can fail the waiters.
+        """
+        timestamp = _now_iso()
+        # In-batch dedupe: identical content queued in the same batch
+        # would produce identical IDs (content + per-ms timestamp) and
+        # make the single add() call reject the whole batch. Duplicates
+        # resolve to the first occurrence, mirroring the dedupe cache.
+        first_index: dict[str, int] = {}
+        unique_items: list[tuple] = []
+        for item in batch:
+            if item[5] not in first_index:
+                first_index[item[5]] = len(unique_items)
+                unique_items.append(item)
+
+        texts = [item[0] for item in unique_items]
+        # IDs first (SIMD-hashed, trivially cheap), then one batched
+        # forward pass that amortizes model overhead over the whole batch
+        entry_ids = [self._generate_id(text, timestamp) for text in texts]
+        embeddings = self._embed_batch(texts)
+
+        entries = []
+        metadatas = []
+        for (content, memory_type, metadata, success, error_message, content_hash, _), entry_id, embedding in zip(unique_items, entry_ids, embeddings):
+            entry = MemoryEntry(
+                id=entry_id,
+                type=memory_type,
+                content=content,
+                metadata=metadata,
+                timestamp=timestamp,
+                embedding=embedding,
+                success=success,
+                error_message=error_message,
+            )
+            entries.append(entry)
+            metadatas.append({
+                "type": memory_type.value,
+                "success": success,
+                "error": error_message or "",
+                "timestamp": timestamp,
+                "content_hash": content_hash,
+                # User metadata is namespaced so recall() can split it off
+                # with a cheap prefix check instead of set lookups per key
+                **{"x_" + k: v for k, v in metadata.items()}
+            })
+
+        self.collection.add(
+            ids=[entry.id for entry in entries],
+            documents=[entry.content for entry in entries],
+            embeddings=(
+                [
+                    np.asarray(entry.embedding, dtype=np.float32)
+                    if np is not None else entry.embedding
+                    for entry in entries
+                ]
+                if all(entry.embedding is not None for entry in entries) else None
+            ),
+            metadatas=metadatas,
+        )
+        self.entry_count += len(entries)
+        self._version += 1
+        logger.debug(f"Memory stored: {len(entries)} entries in one batch")
+
+        # Only content that actually persisted enters the dedupe cache
+        for entry, item in zip(entries, unique_items):
+            self._dedupe_cache[item[5]] = entry
+            if len(self._dedupe_cache) > self._dedupe_cache_max:
+                self._dedupe_cache.popitem(last=False)
+
+        return [entries[first_index[item[5]]] for item in batch]
+
+    async def recall(
+        self,
+        query: str,
+        limit: int = 5,
+        memory_type: Optional[MemoryType] = None,
+        success_only: bool = False,
+    ) -> list[MemoryEntry]:
+        """
+        Recall similar memories using semantic search.
+        
+        Args:
+            query: Semantic query (similar to past memories)
+            limit: Max results to return
+            memory_type: Filter by memory type
+            success_only: Only return successful actions
+            
+        Returns:
+            List of similar MemoryEntry objects, ordered by relevance
+        """
+        await self._ensure_ready()
+        if not self.enabled:
+            return []
+
+        # Read-your-writes: drain the write-behind buffer first
+        await self.flush()
+
+        cache_key = (query, limit, memory_type, success_only, self._version)
+        cached = self._recall_cache.get(cache_key)
+        if cached is not None:
+            self._recall_cache.move_to_end(cache_key)
+            # Copy so callers can't mutate the cached list
+            return list(cached)
+
+        embedding = await asyncio.to_thread(self._embed, query)
+        if embedding is None:
+            return []
+
+        try:
+            where_filter = self._where_filters[(memory_type, success_only)]
+
+            # HNSW search can take milliseconds; keep it off the event loop
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=[embedding],
+                n_results=limit,
+                where=where_filter,
+                include=_RECALL_INCLUDE,
+            )
+
+            memories = []
+            if results and results["ids"] and len(results["ids"]) > 0:
+                for i, entry_id in enumerate(results["ids"][0]):
+                    metadata = results["metadatas"][0][i]
+                    document = results["documents"][0][i]
+
+                    memory = MemoryEntry(
+                        id=entry_id,
+                        type=MemoryType(metadata.get("type", "action")),
+                        content=document,
+                        metadata={
+                            k[2:]: v for k, v in metadata.items()
+                            if k.startswith("x_")
+                        },
+                        timestamp=metadata.get("timestamp") or _now_iso(),
+                        success=metadata.get("success", True),
+                        error_message=metadata.get("error"),
+                    )
+                    memories.append(memory)
+
+            self._recall_cache[cache_key] = memories
+            if len(self._recall_cache) > self._recall_cache_max:
+                self._recall_cache.popitem(last=False)
+
+            logger.debug(f"Recalled {len(memories)} memories for query: {query[:50]}...")
+            return list(memories)
+
+        except Exception as e:
+            logger.error(f"Recall failed: {e}")
+            return []
+
+    async def learn_from_success(
+        self,
+        action: str,
+        result: str,
+        tool: str,
+        context: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store a successful action for future learning.
+        
+        Args:
+            action: The action that succeeded
+            result: The result/outcome
+            tool: Tool that was used
+            context: Additional context
+        """
+        metadata = {"tool": tool, "result": result, **(context or {})}
+        await self.store(
+            content=f"{action} → {result}",
+            memory_type=MemoryType.SUCCESS,
+            metadata=metadata,
+            success=True,
+        )
+
+    async def learn_from_error(
+        self,
+        action: str,
+        error: str,
+        tool: str,
+        attempted_fixes: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Store a failed action for learning and recovery.
+        
+        Args:
+            action: The action that failed
+            error: Error message
+            tool: Tool that failed
+            attempted_fixes: Fixes that were already tried
+        """
+        metadata = {
+            "tool": tool,
+            "attempted_fixes": attempted_fixes or [],
+        }
+        await self.store(
+            content=f"ERROR: {action} failed",
+            memory_type=MemoryType.ERROR,
+            metadata=metadata,
+            success=False,
+            error_message=error,
+        )
+
+    async def get_similar_successes(self, action: str, limit: int = 3) -> list[MemoryEntry]:
+        """Get successful past actions similar to the given action."""
+        return await self.recall(
+            query=action,
+            limit=limit,
+            memory_type=MemoryType.SUCCESS,
+            success_only=True,
+        )
+
+    async def get_similar_errors(self, action: str, limit: int = 3) -> list[MemoryEntry]:
+        """Get failed past actions similar to the given action."""
+        return await self.recall(
+            query=action,
+            limit=limit,
+            memory_type=MemoryType.ERROR,
+            success_only=False,
+        )
+
+    def clear_memory(self) -> None:
+        """Clear all memory entries. Use with caution!"""
+        if not self.enabled or self.client is None:
+            return
+        
+        try:
+            self.client.delete_collection(name=self.collection_name)
+            self.collection = self.client.get_or_create_collection(
+                name=self.collection_name,
+                metadata={"hnsw:space": "cosine"}
+            )
+            self.entry_count = 0
+            self._version += 1
+            self._recall_cache.clear()
+            self._dedupe_cache.clear()
+            logger.warning("Memory cleared!")
+        except Exception as e:
+            logger.error(f"Failed to clear memory: {e}")
+
+    def export_memory(self, path: str) -> None:
+        """
+        Export all memories to JSON file.
+
+        Entries are streamed in pages so peak memory stays O(page) instead
+        of materializing the whole collection; orjson handles the
+        per-entry serialization when installed.
+        """
+        if not self.enabled or self.collection is None:
+            return
+
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda obj: json.dumps(obj).encode()
+
+        try:
+            total = self._count_entries()
+            with open(path, "wb") as f:
+                f.write(b'{"exported_at":')
+                f.write(dumps(_now_iso()))
+                f.write(b',"total_entries":%d,"entries":[' % total)
+
+                first = True
+                for offset in range(0, total, _EXPORT_PAGE):
+                    batch = self.collection.get(
+                        limit=_EXPORT_PAGE,
+                        offset=offset,
+                        include=["documents", "metadatas"],
+                    )
+                    for i, entry_id in enumerate(batch["ids"]):
+                        if not first:
+                            f.write(b",")
+                        first = False
+                        f.write(dumps({
+                            "id": entry_id,
+                            "document": batch["documents"][i],
+                            "metadata": batch["metadatas"][i],
+                        }))
+
+                f.write(b"]}")
+
+            logger.info(f"Memory exported to {path}")
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get memory statistics."""
+        if not self.enabled:
+            return {"enabled": False}
+
+        return {
+            "enabled": True,
+            "total_entries": self._count_entries(),
+            "collection": self.collection_name,
+            "model": self.model_name,
+            "db_path": self.db_path,
+        }
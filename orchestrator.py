@@ -17,11 +17,35 @@ Exemplo:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import re
 import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
-from enum import Enum
+from enum import Enum, IntEnum
 
 from pydantic_ai import Agent, ModelMessage
 from loguru import logger
@@ -38,6 +62,86 @@ except ImportError:
     PluginLoader = None
 
 
+# Sessões HTTP reutilizadas por event loop (evita handshake TCP+TLS por turno)
+_http_sessions: dict[int, "aiohttp.ClientSession"] = {}
+
+
+def get_http_session() -> "aiohttp.ClientSession":
+    """
+    Retorna a ClientSession aiohttp cacheada para o event loop atual.
+
+    Chamadas ao modelo de IA dentro de execute_objective devem reusar
+    esta sessão: em 15 iterações isso economiza 14 handshakes TCP+TLS.
+    A sessão é criada sob demanda com keep-alive e cache de DNS.
+
+    Returns:
+        ClientSession viva associada ao loop corrente.
+
+    Raises:
+        RuntimeError: Se aiohttp não estiver instalado.
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp não está instalado")
+
+    loop_id = id(asyncio.get_running_loop())
+    session = _http_sessions.get(loop_id)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+        )
+        _http_sessions[loop_id] = session
+    return session
+
+
+async def close_http_sessions() -> None:
+    """Fecha as sessões HTTP cacheadas (chamar no shutdown da aplicação)."""
+    for session in _http_sessions.values():
+        if not session.closed:
+            await session.close()
+    _http_sessions.clear()
+
+
+def dumps_payload(obj: Any) -> str:
+    """
+    Serializa payloads de log e de ferramentas para JSON.
+
+    Usa orjson (serializador em C, 3-10x mais rápido que o json da
+    stdlib em dicts de primitivos) quando instalado; caso contrário,
+    cai no json padrão.
+
+    Args:
+        obj: Estrutura a serializar.
+
+    Returns:
+        String JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
+
+def loads_payload(data: str | bytes) -> Any:
+    """
+    Desserializa payloads JSON vindos do modelo ou de ferramentas.
+
+    Contraparte de dumps_payload: usa orjson quando instalado (aceita
+    bytes diretamente, sem decode intermediário).
+
+    Args:
+        data: JSON em str ou bytes.
+
+    Returns:
+        Estrutura Python desserializada.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ModelProvider(str, Enum):
     """Provedores de modelos de IA suportados."""
     
@@ -46,17 +150,148 @@ class ModelProvider(str, Enum):
     GEMINI = "gemini"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionLog:
     """Log de uma ação executada."""
-    
+
     iteration: int
-    action_type: str  # "security_check", "ai_decision", "tool_execution"
+    action_type: int  # ver ActionType
     tool_name: Optional[str] = None
     security_validated: bool = False
     success: bool = False
-    details: dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
+    # None em vez de default_factory=dict: evita alocar um dict vazio
+    # (~232 bytes) por entrada; a formatação materializa com `or {}`
+    details: Optional[dict[str, Any]] = None
+    timestamp: int = field(default_factory=time.monotonic_ns)
+
+
+# Bordas do banner construídas uma única vez no import, não por objetivo
+_BORDER_TOP = "╔" + "═" * 78 + "╗"
+_BORDER_BOTTOM = "╚" + "═" * 78 + "╝"
+
+
+class ActionType(IntEnum):
+    """Tipos de ação registrados no log (ints compactos, interned)."""
+
+    SECURITY_CHECK = 0
+    AI_DECISION = 1
+    TOOL_EXECUTION = 2
+    ERROR = 3
+
+
+# Nomes na ordem dos valores de ActionType, para a formatação de saída
+_ACTION_TYPE_NAMES = ("security_check", "ai_decision", "tool_execution", "error")
+
+
+class _ActionLogStore:
+    """
+    Log de ações em layout struct-of-arrays.
+
+    Os campos de largura fixa (iteração, tipo, flags, timestamp) vivem em
+    arrays numpy tipados — sem um dict por entrada — e só tool_name e
+    details ficam como objetos Python. Em execuções longas isso reduz o
+    consumo por entrada em várias vezes e acelera a formatação final.
+    Sem numpy instalado, cai em listas simples com a mesma interface.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self) -> None:
+        self._use_np = np is not None
+        self._details: list[Optional[dict[str, Any]]] = []
+        self._tool_names: list[Optional[str]] = []
+        self._len = 0
+        if self._use_np:
+            cap = self._INITIAL_CAPACITY
+            self._iter = np.empty(cap, dtype=np.int32)
+            self._type = np.empty(cap, dtype=np.int8)
+            self._success = np.empty(cap, dtype=bool)
+            self._sec = np.empty(cap, dtype=bool)
+            self._ts = np.empty(cap, dtype=np.int64)
+        else:
+            self._iter = []
+            self._type = []
+            self._success = []
+            self._sec = []
+            self._ts = []
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _grow(self) -> None:
+        """Dobra a capacidade dos arrays numpy quando cheios."""
+        new_cap = self._iter.shape[0] * 2
+        self._iter = np.resize(self._iter, new_cap)
+        self._type = np.resize(self._type, new_cap)
+        self._success = np.resize(self._success, new_cap)
+        self._sec = np.resize(self._sec, new_cap)
+        self._ts = np.resize(self._ts, new_cap)
+
+    def append(
+        self,
+        iteration: int,
+        action_type: "ActionType",
+        tool_name: Optional[str],
+        security_validated: bool,
+        success: bool,
+        details: Optional[dict[str, Any]],
+    ) -> None:
+        type_id = int(action_type)
+        if self._use_np:
+            if self._len == self._iter.shape[0]:
+                self._grow()
+            i = self._len
+            self._iter[i] = iteration
+            self._type[i] = type_id
+            self._success[i] = success
+            self._sec[i] = security_validated
+            self._ts[i] = time.monotonic_ns()
+        else:
+            self._iter.append(iteration)
+            self._type.append(type_id)
+            self._success.append(success)
+            self._sec.append(security_validated)
+            self._ts.append(time.monotonic_ns())
+        self._tool_names.append(tool_name)
+        self._details.append(details)
+        self._len += 1
+
+    def clear(self) -> None:
+        """Reinicia o log sem realocar os arrays."""
+        self._len = 0
+        self._tool_names.clear()
+        self._details.clear()
+        if not self._use_np:
+            self._iter.clear()
+            self._type.clear()
+            self._success.clear()
+            self._sec.clear()
+            self._ts.clear()
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materializa o log no formato dict usado na saída da API."""
+        n = self._len
+        if self._use_np:
+            iters = self._iter[:n].tolist()
+            types = self._type[:n].tolist()
+            successes = self._success[:n].tolist()
+            secs = self._sec[:n].tolist()
+        else:
+            iters, types, successes, secs = self._iter, self._type, self._success, self._sec
+
+        return [
+            {
+                "iteration": it,
+                "type": _ACTION_TYPE_NAMES[tp],
+                "tool": tool,
+                "success": ok,
+                "security_validated": sec,
+                "details": det or {},
+            }
+            for it, tp, tool, ok, sec, det in zip(
+                iters, types, self._tool_names, successes, secs, self._details
+            )
+        ]
 
 
 class PyOSOrchestrator:
@@ -80,6 +315,15 @@ class PyOSOrchestrator:
         action_log: Histórico de ações executadas.
     """
 
+    # Linha de validação por ferramenta, colada no corpo do wrapper
+    # gerado em _wrap_tool_with_security — avaliação parcial levada ao
+    # extremo: o bytecode final tem chamadas de segurança em linha reta,
+    # sem loop nem comparação de tool_name por invocação
+    _VALIDATOR_SRC: dict[str, str] = {
+        "execute_command": 'check_command(args[0] if args else kwargs.get("command", ""))',
+        "read_file": 'check_path(args[0] if args else kwargs.get("path", ""))',
+    }
+
     def __init__(
         self,
         settings: Optional[Settings] = None,
@@ -104,9 +348,22 @@ class PyOSOrchestrator:
         self.shield = shield or SecurityShield()
         self.model_provider = model_provider
         self.max_iterations = max_iterations
+        # Janela de histórico enviada ao modelo: deque(maxlen) limita a
+        # memória e o custo de serialização em objetivos longos
+        self.max_history = getattr(self.settings, "max_history", 32)
+        self._history_serialized = bytearray()
+        self._history_stale = 0
         self.tools: dict[str, Callable[..., Any]] = {}
+        self.tool_dependencies: dict[str, tuple[str, ...]] = {}
+        self.tool_parallel_safe: dict[str, bool] = {}
+        # Peças invariantes do prompt, atualizadas apenas quando o
+        # conjunto de ferramentas ou o objetivo mudam (não por iteração)
+        self._tool_names_str = ""
+        self._prompt_prefix = ""
+        self._prompt_prefix_objective: Optional[str] = None
+        self._prompt_suffix = ""
         self.iteration_count = 0
-        self.action_log: list[ActionLog] = []
+        self.action_log = _ActionLogStore()
         
         # Semantic Memory para aprendizado
         self.memory = SemanticMemory() if enable_memory else None
@@ -116,6 +373,38 @@ class PyOSOrchestrator:
         if auto_load_plugins and PluginLoader:
             self.plugin_loader = PluginLoader()
         
+        # Memoização das validações do shield: num loop de agente os
+        # mesmos comandos/caminhos recorrem o tempo todo. lru_cache não
+        # cacheia exceções, então a negativa vira a mensagem de violação
+        # (cacheada também) e é re-levantada em _check_command/_check_path.
+        self._validate_command_cached = functools.lru_cache(maxsize=1024)(
+            self._validate_command_uncached
+        )
+        self._validate_path_cached = functools.lru_cache(maxsize=1024)(
+            self._validate_path_uncached
+        )
+
+        # Cache semântico das buscas de similaridade da auto-cura:
+        # hit exato por string e, com numpy, reuso por cosseno >= 0.95
+        # sobre um ring buffer contíguo de embeddings recentes
+        self._sim_cache: OrderedDict[str, tuple[list, list]] = OrderedDict()
+        self._sim_cache_max = 256
+        self._sim_threshold = 0.95
+        self._sim_emb = None  # matriz (N, d) float32, alocada no 1º uso
+        self._sim_keys: list[str] = []
+        self._sim_pos = 0
+
+        # Micro-batching dos embeddings de retry: queries concorrentes
+        # numa mesma janela viram um único forward pass no modelo
+        self._pending_embed: list[tuple[str, asyncio.Future]] = []
+        self._embed_flush_task: Optional[asyncio.Task] = None
+        self._embed_batch_max = 16
+        self._embed_batch_delay = 0.01  # segundos de espera por mais queries
+
+        # DFA Hyperscan para os padrões de erro da auto-cura (mesma
+        # estratégia do SecurityShield); None cai na alternação re
+        self._error_db = self._compile_error_db()
+
         # Rastreamento de tentativas (para auto-cura)
         self.tool_attempts: dict[str, list[str]] = {}  # tool_name -> [prev_errors]
         self.max_retries = 3
@@ -179,125 +468,217 @@ class PyOSOrchestrator:
         name: str,
         func: Callable[..., Any],
         description: str,
+        depends_on: tuple[str, ...] = (),
+        parallel_safe: bool = False,
     ) -> None:
         """
         Registra uma ferramenta disponível com validação de segurança.
-        
+
         Args:
             name: Nome da ferramenta.
             func: Função a executar.
             description: Descrição do que a ferramenta faz.
+            depends_on: Ferramentas que devem completar antes desta
+                quando agendada via execute_task_graph.
+            parallel_safe: Ferramenta sem efeitos colaterais, elegível
+                para execução concorrente quando a IA propõe várias
+                chamadas na mesma iteração.
         """
         # Envolver função com validação de segurança
         wrapped_func = self._wrap_tool_with_security(name, func)
         self.tools[name] = wrapped_func
-        
+        self.tool_dependencies[name] = tuple(depends_on)
+        self.tool_parallel_safe[name] = parallel_safe
+        self._tool_names_str = ", ".join(self.tools.keys())
+        self._prompt_suffix = (
+            f"Ferramentas disponíveis: {self._tool_names_str}\n"
+            f"Escolha uma ferramenta para executar ou sinalize como concluído (done=true)."
+        )
+
         logger.info(f"✓ Ferramenta registrada: {name} - {description}")
 
+    async def execute_task_graph(
+        self,
+        tasks: list[dict[str, Any]],
+    ) -> dict[str, ToolResult]:
+        """
+        Executa um conjunto de chamadas de ferramentas como um DAG.
+
+        Tarefas independentes são despachadas em paralelo via
+        asyncio.create_task; cada conclusão promove sucessores cujas
+        dependências foram satisfeitas. Tarefas sem dependências (ex:
+        take_screenshot) rodam concorrentes a comandos longos.
+
+        Args:
+            tasks: Lista de nós no formato
+                {"id": str, "tool_name": str, "tool_args": dict,
+                 "depends_on": tuple[str, ...]}.
+                "depends_on" é opcional e cai no default registrado
+                em register_tool.
+
+        Returns:
+            Dicionário id do nó -> ToolResult.
+        """
+        pending_nodes = {t["id"]: t for t in tasks}
+        deps: dict[str, set[str]] = {
+            t["id"]: set(t.get("depends_on", self.tool_dependencies.get(t["tool_name"], ())))
+            for t in tasks
+        }
+        results: dict[str, ToolResult] = {}
+        running: dict[asyncio.Task, str] = {}
+
+        def _launch_ready() -> None:
+            for node_id in list(pending_nodes):
+                if deps[node_id] <= results.keys():
+                    node = pending_nodes.pop(node_id)
+                    task = asyncio.create_task(
+                        self._execute_tool(node["tool_name"], node.get("tool_args", {}))
+                    )
+                    running[task] = node_id
+
+        _launch_ready()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node_id = running.pop(task)
+                results[node_id] = task.result()
+                logger.debug(f"Nó do grafo completado: {node_id}")
+            _launch_ready()
+
+        if pending_nodes:
+            logger.warning(
+                f"Nós com dependências insatisfeitas não executados: {list(pending_nodes)}"
+            )
+
+        return results
+
+    def _validate_command_uncached(self, command: str) -> Optional[str]:
+        """Valida comando no shield; retorna a mensagem de violação ou None."""
+        try:
+            self.shield.validate_command(command)
+            return None
+        except SecurityViolationError as e:
+            return str(e)
+
+    def _validate_path_uncached(self, path: str) -> Optional[str]:
+        """Valida caminho no shield; retorna a mensagem de violação ou None."""
+        try:
+            self.shield.validate_path(path)
+            return None
+        except SecurityViolationError as e:
+            return str(e)
+
+    def _check_command(self, command: str) -> None:
+        """Validação de comando com memoização (positivos e negativos)."""
+        denial = self._validate_command_cached(command)
+        if denial is not None:
+            raise SecurityViolationError(denial)
+
+    def _check_path(self, path: str) -> None:
+        """Validação de caminho com memoização (positivos e negativos)."""
+        denial = self._validate_path_cached(path)
+        if denial is not None:
+            raise SecurityViolationError(denial)
+
+    def invalidate_security_cache(self) -> None:
+        """Limpa a memoização das validações (chamar após alterar o shield)."""
+        self._validate_command_cached.cache_clear()
+        self._validate_path_cached.cache_clear()
+
     def _wrap_tool_with_security(
         self,
         tool_name: str,
         func: Callable[..., Any],
     ) -> Callable[..., Any]:
         """
-        Envolve uma ferramenta com validação de segurança obrigatória.
-        
+        Gera um wrapper especializado por ferramenta com exec().
+
         FLUXO DE SEGURANÇA:
         1. Validar que ferramenta é permitida
         2. Validar argumentos de entrada
         3. Executar ferramenta
         4. Registrar em log
         5. Retornar resultado
-        
+
+        Em vez de um wrapper genérico que percorre uma lista de
+        validadores a cada chamada, o corpo é montado no registro a
+        partir de _VALIDATOR_SRC: o bytecode resultante contém só as
+        chamadas de segurança pertinentes à ferramenta, em linha reta,
+        sem loop nem branch por invocação.
+
         Args:
             tool_name: Nome da ferramenta.
             func: Função a envolver.
-            
+
         Returns:
-            Função decorada com validação.
+            Função gerada com validação embutida.
         """
-        def wrapper(*args: Any, **kwargs: Any) -> ToolResult:
-            start_time = time.time()
-            
-            try:
-                # VALIDAÇÃO DE SEGURANÇA #1: Ferramenta registrada
-                if tool_name not in self.tools:
-                    logger.critical(f"🚨 Tentativa de usar ferramenta não registrada: {tool_name}")
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Ferramenta não registrada: {tool_name}",
-                        # security_validated=False,
-                    )
-                
-                logger.debug(f"[SEC-PASS] Ferramenta {tool_name} está registrada")
-                
-                # VALIDAÇÃO DE SEGURANÇA #2: Validar argumentos
-                # Para comandos terminal, validar contra SecurityShield
-                if tool_name == "execute_command" and args:
-                    command = args[0] if args else kwargs.get("command", "")
-                    if self.settings.security_enabled:
-                        try:
-                            self.shield.validate_command(command)
-                            logger.debug(f"[SEC-PASS] Comando validado: {command}")
-                        except SecurityViolationError as e:
-                            logger.warning(f"🚫 Comando bloqueado: {e}")
-                            return ToolResult(
-                                success=False,
-                                output="",
-                                error=str(e),
-                                # security_validated=False,
-                            )
-                
-                # VALIDAÇÃO DE SEGURANÇA #3: Validar caminhos
-                if tool_name == "read_file" and args:
-                    path = args[0] if args else kwargs.get("path", "")
-                    if self.settings.security_enabled:
-                        try:
-                            self.shield.validate_path(path)
-                            logger.debug(f"[SEC-PASS] Caminho validado: {path}")
-                        except SecurityViolationError as e:
-                            logger.warning(f"🚫 Caminho bloqueado: {e}")
-                            return ToolResult(
-                                success=False,
-                                output="",
-                                error=str(e),
-                                # security_validated=False,
-                            )
-                
-                # EXECUÇÃO
-                logger.info(f"▶️  Executando ferramenta: {tool_name}")
-                result = func(*args, **kwargs)
-                
-                execution_time = time.time() - start_time
-                
-                # Converter resultado para ToolResult
-                if isinstance(result, ToolResult):
-                    # result.security_validated = True  # ToolResult from base doesn't have this
-                    result.execution_time_ms = execution_time * 1000
-                    return result
-                
-                logger.info(f"✓ Ferramenta {tool_name} completada em {execution_time:.2f}s")
-                
-                return ToolResult(
-                    success=True,
-                    output=str(result),
-                    # security_validated=True,
-                    execution_time_ms=execution_time * 1000,
+        validator_lines = ""
+        if self.settings.security_enabled:
+            validator_src = self._VALIDATOR_SRC.get(tool_name)
+            if validator_src is not None:
+                validator_lines = (
+                    f"        {validator_src}\n"
+                    "        logger.debug(f\"[SEC-PASS] Argumentos de {tool_name} validados\")\n"
                 )
-                
-            except Exception as e:
-                execution_time = time.time() - start_time
-                logger.error(f"❌ Erro na ferramenta {tool_name}: {e}")
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=str(e),
-                    # security_validated=False,
-                    execution_time_ms=execution_time * 1000,
-                )
-        
-        return wrapper
+
+        src = (
+            "def wrapper(*args, **kwargs):\n"
+            "    # Relógio monotônico em ns: imune a ajustes de wall-clock e\n"
+            "    # uma única leitura por fase em vez de vários time.time()\n"
+            "    start_ns = monotonic_ns()\n"
+            "    try:\n"
+            "        # VALIDAÇÃO DE SEGURANÇA #1 acontece na fronteira: só se\n"
+            "        # chega aqui via orch.tools[tool_name] (assert some com -O)\n"
+            "        assert tool_name in orch.tools, f\"Ferramenta não registrada: {tool_name}\"\n"
+            + validator_lines
+            + "        logger.info(f\"▶️  Executando ferramenta: {tool_name}\")\n"
+            "        result = func(*args, **kwargs)\n"
+            "        execution_time_ms = (monotonic_ns() - start_ns) / 1e6\n"
+            "        if isinstance(result, ToolResult):\n"
+            "            result.execution_time_ms = execution_time_ms\n"
+            "            if result.success and orch.memory is not None:\n"
+            "                # Fire-and-forget: o chamador não precisa da escrita\n"
+            "                create_task(orch.memory.learn_from_success(\n"
+            "                    action=tool_name,\n"
+            "                    result=result.output_preview,\n"
+            "                    tool=tool_name,\n"
+            "                ))\n"
+            "            return result\n"
+            "        logger.info(f\"✓ Ferramenta {tool_name} completada em {execution_time_ms / 1000:.2f}s\")\n"
+            "        return ToolResult(\n"
+            "            success=True,\n"
+            "            output=str(result),\n"
+            "            execution_time_ms=execution_time_ms,\n"
+            "        )\n"
+            "    except SecurityViolationError as e:\n"
+            "        logger.warning(f\"🚫 Bloqueado por segurança: {e}\")\n"
+            "        return ToolResult(success=False, output=\"\", error=str(e))\n"
+            "    except Exception as e:\n"
+            "        execution_time_ms = (monotonic_ns() - start_ns) / 1e6\n"
+            "        logger.error(f\"❌ Erro na ferramenta {tool_name}: {e}\")\n"
+            "        return ToolResult(\n"
+            "            success=False,\n"
+            "            output=\"\",\n"
+            "            error=str(e),\n"
+            "            execution_time_ms=execution_time_ms,\n"
+            "        )\n"
+        )
+
+        namespace: dict[str, Any] = {
+            "orch": self,
+            "func": func,
+            "tool_name": tool_name,
+            "monotonic_ns": time.monotonic_ns,
+            "create_task": asyncio.create_task,
+            "logger": logger,
+            "ToolResult": ToolResult,
+            "SecurityViolationError": SecurityViolationError,
+            "check_command": self._check_command,
+            "check_path": self._check_path,
+        }
+        exec(compile(src, f"<tool_wrapper:{tool_name}>", "exec"), namespace)
+        return namespace["wrapper"]
 
     async def execute_objective(self, objective: str) -> dict[str, Any]:
         """
@@ -321,23 +702,25 @@ class PyOSOrchestrator:
             Dicionário com resultado da execução.
         """
         self.iteration_count = 0
-        self.action_log = []
-        
-        logger.info("╔" + "═" * 78 + "╗")
+        self.action_log.clear()
+
+        logger.info(_BORDER_TOP)
         logger.info(f"║ INICIANDO EXECUÇÃO DE OBJETIVO (Segurança: {'ATIVADA ✓' if self.settings.security_enabled else 'DESATIVADA ⚠️'})")
         logger.info(f"║ Objetivo: {objective}")
         logger.info(f"║ Modelo: {self.model_provider.value}")
         logger.info(f"║ Max iterações: {self.max_iterations}")
         logger.info(f"║ Ferramentas disponíveis: {len(self.tools)}")
-        logger.info("╚" + "═" * 78 + "╝")
+        logger.info(_BORDER_BOTTOM)
         
-        messages: list[ModelMessage] = []
-        start_time = time.time()
+        messages: deque[ModelMessage] = deque(maxlen=self.max_history)
+        self._history_serialized.clear()
+        self._history_stale = 0
+        start_ns = time.monotonic_ns()
         
         while self.iteration_count < self.max_iterations:
             self.iteration_count += 1
             
-            iteration_start = time.time()
+            iteration_start_ns = time.monotonic_ns()
             
             try:
                 # LOG DA ITERAÇÃO
@@ -354,12 +737,12 @@ class PyOSOrchestrator:
                     logger.info(f"Mensagem: {response.get('message', '')}")
                     
                     self._log_action(
-                        action_type="ai_decision",
+                        action_type=ActionType.AI_DECISION,
                         success=True,
                         details={"decision": "done", "message": response.get("message")}
                     )
                     
-                    total_time = time.time() - start_time
+                    total_time = (time.monotonic_ns() - start_ns) / 1e9
                     return {
                         "success": True,
                         "objective": objective,
@@ -369,6 +752,25 @@ class PyOSOrchestrator:
                         "action_log": self._format_action_log(),
                     }
                 
+                # CHAMADAS MÚLTIPLAS: quando a IA propõe várias
+                # ferramentas de uma vez, executá-las como um lote
+                # (em paralelo se todas forem parallel_safe)
+                tool_calls = response.get("tool_calls")
+                if tool_calls and len(tool_calls) > 1:
+                    batch_results = await self._execute_tool_calls(tool_calls)
+
+                    # Um único turno batched no histórico, na ordem proposta
+                    self._append_history(messages, {
+                        "tool": [tc.get("tool_name") for tc in tool_calls],
+                        "result": [r.output for r in batch_results],
+                        "success": all(r.success for r in batch_results),
+                        "timestamp": time.time(),
+                    })
+
+                    iteration_time = (time.monotonic_ns() - iteration_start_ns) / 1e9
+                    logger.debug(f"Iteração (lote) concluída em {iteration_time:.2f}s")
+                    continue
+
                 # EXTRAIR DECISÃO DA IA
                 tool_name = response.get("tool_name")
                 tool_args = response.get("tool_args", {})
@@ -384,7 +786,7 @@ class PyOSOrchestrator:
                     logger.warning(f"⚠️  Ferramenta não reconhecida: {tool_name}")
                     
                     self._log_action(
-                        action_type="ai_decision",
+                        action_type=ActionType.AI_DECISION,
                         success=False,
                         details={"tool": tool_name, "error": "not_found"}
                     )
@@ -394,50 +796,58 @@ class PyOSOrchestrator:
                 logger.debug(f"✓ Ferramenta {tool_name} está registrada e permitida")
                 
                 # EXECUTAR FERRAMENTA (validação obrigatória dentro)
-                logger.info(f"▶️  Executando: {tool_name}({', '.join(f'{k}={v}' for k, v in list(tool_args.items())[:3])}...)")
+                # lazy=True: o join dos argumentos só é construído se o
+                # sink INFO estiver ativo
+                logger.opt(lazy=True).info(
+                    "▶️  Executando: {}({}...)",
+                    lambda: tool_name,
+                    lambda: ", ".join(f"{k}={v}" for k, v in list(tool_args.items())[:3]),
+                )
                 
                 tool_result = await self._execute_tool(tool_name, tool_args)
                 
                 # LOG DO RESULTADO
                 if tool_result.success:
                     logger.info(f"✓ {tool_name} completada com sucesso em {tool_result.execution_time:.2f}s")
-                    logger.debug(f"Saída: {tool_result.output[:100]}..." if len(tool_result.output) > 100 else f"Saída: {tool_result.output}")
+                    logger.opt(lazy=True).debug(
+                        "Saída: {}", lambda: tool_result.output_preview
+                    )
                 else:
                     logger.warning(f"❌ {tool_name} falhou: {tool_result.error}")
                 
                 self._log_action(
-                    action_type="tool_execution",
+                    action_type=ActionType.TOOL_EXECUTION,
                     tool_name=tool_name,
                     success=tool_result.success,
                     security_validated=tool_result.security_validated,
                     details={
-                        "output": tool_result.output[:100] if tool_result.output else "",
+                        "output": tool_result.output_preview if tool_result.output else "",
                         "error": tool_result.error,
                         "execution_time": tool_result.execution_time,
                     }
                 )
                 
                 # ADICIONAR RESULTADO AO HISTÓRICO
-                messages.append({
+                self._append_history(messages, {
                     "tool": tool_name,
                     "result": tool_result.output,
                     "success": tool_result.success,
                     "timestamp": time.time(),
                 })
                 
-                iteration_time = time.time() - iteration_start
+                iteration_time = (time.monotonic_ns() - iteration_start_ns) / 1e9
                 logger.debug(f"Iteração concluída em {iteration_time:.2f}s")
                 
             except Exception as e:
                 logger.error(f"❌ Erro crítico na iteração {self.iteration_count}: {e}")
                 
                 self._log_action(
-                    action_type="error",
+                    action_type=ActionType.ERROR,
                     success=False,
                     details={"error": str(e)}
                 )
                 
-                total_time = time.time() - start_time
+                total_time = (time.monotonic_ns() - start_ns) / 1e9
                 return {
                     "success": False,
                     "objective": objective,
@@ -449,7 +859,7 @@ class PyOSOrchestrator:
         
         # MAX ITERAÇÕES ATINGIDO
         logger.warning(f"⚠️  MÁXIMO DE ITERAÇÕES ({self.max_iterations}) ATINGIDO")
-        total_time = time.time() - start_time
+        total_time = (time.monotonic_ns() - start_ns) / 1e9
         
         return {
             "success": False,
@@ -460,6 +870,40 @@ class PyOSOrchestrator:
             "action_log": self._format_action_log(),
         }
 
+    # Evicções toleradas antes de reserializar o histórico completo
+    _HISTORY_REBUILD_EVERY = 8
+
+    def _append_history(self, messages: deque, msg: dict[str, Any]) -> None:
+        """
+        Anexa um turno ao histórico mantendo a serialização incremental.
+
+        Cada append serializa apenas a mensagem nova (orjson via
+        dumps_payload) em vez de re-encodar a lista inteira por
+        iteração. Quando o deque começa a evictar pela esquerda, o
+        buffer é reconstruído a cada _HISTORY_REBUILD_EVERY appends —
+        entre reconstruções ele pode conter alguns turnos já evictados,
+        o que é aceitável como contexto para o modelo.
+
+        Args:
+            messages: Deque limitado do objetivo corrente.
+            msg: Turno a registrar.
+        """
+        evicting = len(messages) == self.max_history
+        messages.append(msg)
+
+        if evicting:
+            self._history_stale += 1
+            if self._history_stale >= self._HISTORY_REBUILD_EVERY:
+                self._history_serialized = bytearray()
+                for m in messages:
+                    self._history_serialized += dumps_payload(m).encode()
+                    self._history_serialized += b"\n"
+                self._history_stale = 0
+                return
+
+        self._history_serialized += dumps_payload(msg).encode()
+        self._history_serialized += b"\n"
+
     async def _call_model(
         self,
         objective: str,
@@ -475,14 +919,21 @@ class PyOSOrchestrator:
         Returns:
             Decisão do modelo.
         """
+        # Prefixo e sufixo são cacheados; só a linha de histórico muda
+        # a cada iteração. O histórico já serializado está disponível em
+        # bytes(self._history_serialized) para o payload real, sem
+        # re-encodar mensagens inalteradas.
+        if self._prompt_prefix_objective != objective:
+            self._prompt_prefix_objective = objective
+            self._prompt_prefix = f"Objetivo: {objective}\n"
+
         prompt = (
-            f"Objetivo: {objective}\n"
-            f"Histórico de {len(messages)} ações anteriores\n"
-            f"Ferramentas disponíveis: {', '.join(self.tools.keys())}\n"
-            f"Escolha uma ferramenta para executar ou sinalize como concluído (done=true)."
+            self._prompt_prefix
+            + f"Histórico de {len(messages)} ações anteriores\n"
+            + self._prompt_suffix
         )
-        
-        logger.debug(f"Prompt para modelo: {prompt[:100]}...")
+
+        logger.opt(lazy=True).debug("Prompt para modelo: {}...", lambda: prompt[:100])
         
         # PLACEHOLDER: Integração real com Pydantic AI
         return {
@@ -500,17 +951,16 @@ class PyOSOrchestrator:
     ) -> ToolResult:
         """
         Executa uma ferramenta registrada com auto-cura em caso de falha.
-        
-        Fluxo:
-        1. Valida ferramenta existe
-        2. Tenta executar
-        3. Se falhar, ativa auto-cura (retry inteligente)
-        4. Se exaurir retries, retorna erro com contexto
-        
+
+        Despacho fino: self.tools[tool_name] já é o wrapper de segurança,
+        que captura exceções, mede o tempo e registra sucesso na memória.
+        Aqui só resta validar o nome e acionar a auto-cura quando o
+        resultado vem como falha.
+
         Args:
             tool_name: Nome da ferramenta.
             tool_args: Argumentos para a ferramenta.
-            
+
         Returns:
             Resultado da execução.
         """
@@ -520,55 +970,116 @@ class PyOSOrchestrator:
                 output="",
                 error=f"Ferramenta não encontrada: {tool_name}",
             )
-        
+
+        result = self.tools[tool_name](**tool_args)
+        if result.success:
+            return result
+
+        error_msg = result.error or ""
+        logger.warning(f"❌ Erro ao executar {tool_name}: {error_msg}")
+
+        # Tentar auto-cura
+        return await self._analyze_and_retry_tool(
+            tool_name=tool_name,
+            tool_args=tool_args,
+            original_error=error_msg,
+            attempt=1,
+        )
+
+    async def _execute_tool_calls(
+        self,
+        tool_calls: list[dict[str, Any]],
+    ) -> list[ToolResult]:
+        """
+        Executa um lote de chamadas de ferramentas propostas pela IA.
+
+        Se todas as ferramentas forem parallel_safe (sem efeitos
+        colaterais), as chamadas rodam concorrentes num TaskGroup —
+        N screenshots/leituras custam o tempo da mais lenta. Caso
+        contrário, o lote degrada para execução sequencial na ordem
+        proposta. Os resultados retornam sempre na ordem de entrada.
+
+        Args:
+            tool_calls: Lista de {"tool_name": str, "tool_args": dict}.
+
+        Returns:
+            Lista de ToolResult na mesma ordem de tool_calls.
+        """
+        names = [tc.get("tool_name") for tc in tool_calls]
+        all_parallel = all(
+            name in self.tools and self.tool_parallel_safe.get(name, False)
+            for name in names
+        )
+
+        if all_parallel:
+            logger.info(f"🎯 IA decidiu usar {len(tool_calls)} ferramentas em paralelo: {names}")
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        self._execute_tool(tc["tool_name"], tc.get("tool_args", {}))
+                    )
+                    for tc in tool_calls
+                ]
+            results = [task.result() for task in tasks]
+        else:
+            logger.info(f"🎯 IA decidiu usar {len(tool_calls)} ferramentas em sequência: {names}")
+            results = []
+            for tc in tool_calls:
+                results.append(
+                    await self._execute_tool(tc.get("tool_name", ""), tc.get("tool_args", {}))
+                )
+
+        for name, tool_result in zip(names, results):
+            self._log_action(
+                action_type=ActionType.TOOL_EXECUTION,
+                tool_name=name,
+                success=tool_result.success,
+                details={
+                    "output": tool_result.output_preview if tool_result.output else "",
+                    "error": tool_result.error,
+                    "parallel": all_parallel,
+                },
+            )
+
+        return results
+
+    async def _invoke_tool_raw(
+        self,
+        tool_name: str,
+        tool_args: dict[str, Any],
+    ) -> ToolResult:
+        """
+        Invoca a ferramenta registrada sem entrar no laço de auto-cura.
+
+        Usada pelo retry iterativo para evitar a recursão mútua entre
+        _execute_tool e _analyze_and_retry_tool.
+        """
         try:
-            tool_func = self.tools[tool_name]
-            result = tool_func(**tool_args)
-            
+            result = self.tools[tool_name](**tool_args)
             if isinstance(result, ToolResult):
-                # Se bem-sucedido, registrar no histórico
-                if result.success and self.memory:
-                    await self.memory.learn_from_success(
-                        action=f"{tool_name}",
-                        result=result.output[:100],
-                        tool=tool_name,
-                    )
                 return result
-            
             return ToolResult(success=True, output=str(result))
-            
         except Exception as e:
-            error_msg = str(e)
-            logger.warning(f"❌ Erro ao executar {tool_name}: {error_msg}")
-            
-            # Tentar auto-cura
-            return await self._analyze_and_retry_tool(
-                tool_name=tool_name,
-                tool_args=tool_args,
-                original_error=error_msg,
-                attempt=1,
-            )
+            return ToolResult(success=False, output="", error=str(e))
 
 
     def _log_action(
         self,
-        action_type: str,
+        action_type: ActionType,
         tool_name: Optional[str] = None,
         success: bool = False,
         security_validated: bool = False,
         details: Optional[dict[str, Any]] = None,
     ) -> None:
         """Registra uma ação no log de auditoria."""
-        action = ActionLog(
+        self.action_log.append(
             iteration=self.iteration_count,
             action_type=action_type,
             tool_name=tool_name,
             security_validated=security_validated,
             success=success,
-            details=details or {},
+            details=details,
         )
-        
-        self.action_log.append(action)
 
     async def _analyze_and_retry_tool(
         self,
@@ -595,81 +1106,170 @@ class PyOSOrchestrator:
         Returns:
             ToolResult com resultado de retry ou False se exauridas tentativas
         """
-        logger.warning(
-            f"🔧 Ativando auto-cura (tentativa {attempt}/{self.max_retries}): {tool_name}"
-        )
-        
-        if attempt > self.max_retries:
-            logger.error(f"❌ Auto-cura exaurida após {self.max_retries} tentativas")
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Falha permanente após {self.max_retries} tentativas: {original_error}",
+        # Laço iterativo: evita empilhar um frame de corrotina por
+        # tentativa (antes a função recursava via _execute_tool)
+        corrected_args = tool_args
+
+        while True:
+            logger.warning(
+                f"🔧 Ativando auto-cura (tentativa {attempt}/{self.max_retries}): {tool_name}"
             )
 
-        # FASE 1: Buscar experiências similares no histórico
-        similar_successes = []
-        similar_errors = []
-        
-        if self.memory:
-            query = f"{tool_name} {' '.join(str(v)[:20] for v in tool_args.values())}"
-            
-            similar_successes = await self.memory.get_similar_successes(query, limit=2)
-            similar_errors = await self.memory.get_similar_errors(query, limit=2)
-            
-            logger.debug(f"  📚 Encontrados {len(similar_successes)} sucessos similares")
-            logger.debug(f"  ⚠️  Encontrados {len(similar_errors)} erros similares")
-
-        # FASE 2: Analisar padrão de erro e propor correção
-        corrected_args = await self._propose_error_fix(
-            tool_name,
-            tool_args,
-            original_error,
-            similar_errors,
-        )
+            if attempt > self.max_retries:
+                logger.error(f"❌ Auto-cura exaurida após {self.max_retries} tentativas")
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Falha permanente após {self.max_retries} tentativas: {original_error}",
+                )
+
+            # FASE 1: Buscar experiências similares no histórico
+            similar_successes = []
+            similar_errors = []
 
-        if corrected_args != tool_args:
-            logger.info(f"  💡 Proposta de correção: {corrected_args}")
-        
-        # FASE 3: Tentar novamente com argumentos corrigidos
-        logger.info(f"  ▶️  Re-tentando {tool_name} com argumentos corrigidos...")
-        
-        retriable_result = await self._execute_tool(tool_name, corrected_args)
-        
-        # FASE 4: Registrar resultado no histórico semântico
-        action_desc = f"{tool_name}({', '.join(f'{k}={v}' for k, v in list(corrected_args.items())[:2])})"
-        
-        if retriable_result.success:
-            logger.info(f"  ✅ Auto-cura bem-sucedida!")
-            
             if self.memory:
-                await self.memory.learn_from_success(
-                    action=action_desc,
-                    result=retriable_result.output[:100],
-                    tool=tool_name,
-                    context={"original_error": original_error, "attempt": attempt},
-                )
-            
-            return retriable_result
-        
-        else:
+                query = f"{tool_name} {' '.join(str(v)[:20] for v in corrected_args.values())}"
+
+                similar_successes, similar_errors = await self._similar_context(query)
+
+                logger.debug(f"  📚 Encontrados {len(similar_successes)} sucessos similares")
+                logger.debug(f"  ⚠️  Encontrados {len(similar_errors)} erros similares")
+
+            # FASE 2: Analisar padrão de erro e propor correção
+            proposed_args = await self._propose_error_fix(
+                tool_name,
+                corrected_args,
+                original_error,
+                similar_errors,
+            )
+
+            if proposed_args != corrected_args:
+                logger.info(f"  💡 Proposta de correção: {proposed_args}")
+            corrected_args = proposed_args
+
+            # FASE 3: Tentar novamente com argumentos corrigidos
+            logger.info(f"  ▶️  Re-tentando {tool_name} com argumentos corrigidos...")
+
+            retriable_result = await self._invoke_tool_raw(tool_name, corrected_args)
+
+            # FASE 4: Registrar resultado no histórico semântico
+            action_desc = f"{tool_name}({', '.join(f'{k}={v}' for k, v in list(corrected_args.items())[:2])})"
+
+            if retriable_result.success:
+                logger.info(f"  ✅ Auto-cura bem-sucedida!")
+
+                if self.memory:
+                    # Fire-and-forget: o resultado não depende da escrita
+                    asyncio.create_task(self.memory.learn_from_success(
+                        action=action_desc,
+                        result=retriable_result.output_preview,
+                        tool=tool_name,
+                        context={"original_error": original_error, "attempt": attempt},
+                    ))
+
+                return retriable_result
+
             logger.warning(f"  ❌ Re-tentativa falhou: {retriable_result.error}")
-            
+
             if self.memory:
-                await self.memory.learn_from_error(
+                asyncio.create_task(self.memory.learn_from_error(
                     action=action_desc,
                     error=retriable_result.error,
                     tool=tool_name,
                     attempted_fixes=[original_error],
-                )
-            
-            # Tentar novamente recursivamente
-            return await self._analyze_and_retry_tool(
-                tool_name=tool_name,
-                tool_args=corrected_args,
-                original_error=retriable_result.error or original_error,
-                attempt=attempt + 1,
-            )
+                ))
+
+            # Próxima volta do laço com o erro mais recente
+            attempt += 1
+            original_error = retriable_result.error or original_error
+
+    async def _embed_query(self, query: str) -> Optional[Any]:
+        """
+        Embute uma query via lote: enfileira e aguarda o flush em batch.
+
+        Retries concorrentes dentro da janela compartilham um único
+        encode() batched em vez de N forward passes individuais.
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_embed.append((query, future))
+        if self._embed_flush_task is None or self._embed_flush_task.done():
+            self._embed_flush_task = asyncio.create_task(self._flush_embed_batch())
+        return await future
+
+    async def _flush_embed_batch(self) -> None:
+        """Drena a fila de embeddings em lotes de até _embed_batch_max."""
+        while self._pending_embed:
+            if len(self._pending_embed) < self._embed_batch_max:
+                await asyncio.sleep(self._embed_batch_delay)
+            batch = self._pending_embed[:self._embed_batch_max]
+            del self._pending_embed[:len(batch)]
+
+            try:
+                embeddings = await self.memory.embed_batch([q for q, _ in batch])
+            except Exception as e:
+                logger.error(f"Falha no embed em lote: {e}")
+                embeddings = [None] * len(batch)
+
+            for (_, future), emb in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(emb)
+
+    async def _similar_context(self, query: str) -> tuple[list, list]:
+        """
+        Busca sucessos/erros similares com cache semântico.
+
+        Fast path: hit exato pela string da query. Com numpy disponível,
+        um embedding próximo (cosseno >= _sim_threshold) de uma query
+        recente reusa os resultados dela, evitando a busca ANN inteira.
+        """
+        cached = self._sim_cache.get(query)
+        if cached is not None:
+            self._sim_cache.move_to_end(query)
+            return cached
+
+        vec = None
+        if np is not None:
+            emb = await self._embed_query(query)
+            if emb is not None:
+                vec = np.asarray(emb, dtype=np.float32)
+                norm = float(np.linalg.norm(vec))
+                if norm > 0.0:
+                    vec /= norm
+                else:
+                    vec = None
+
+            if vec is not None and self._sim_keys:
+                # Produto escalar vetorizado contra o ring buffer inteiro
+                sims = self._sim_emb[:len(self._sim_keys)] @ vec
+                best = int(np.argmax(sims))
+                if sims[best] >= self._sim_threshold:
+                    hit = self._sim_cache.get(self._sim_keys[best])
+                    if hit is not None:
+                        logger.debug(f"  ♻️  Cache semântico: reusando '{self._sim_keys[best][:40]}'")
+                        return hit
+
+        results = await asyncio.gather(
+            self.memory.get_similar_successes(query, limit=2),
+            self.memory.get_similar_errors(query, limit=2),
+        )
+        results = (results[0], results[1])
+
+        self._sim_cache[query] = results
+        if len(self._sim_cache) > self._sim_cache_max:
+            self._sim_cache.popitem(last=False)
+
+        if vec is not None:
+            if self._sim_emb is None:
+                self._sim_emb = np.zeros((self._sim_cache_max, vec.size), dtype=np.float32)
+            if len(self._sim_keys) < self._sim_cache_max:
+                self._sim_emb[len(self._sim_keys)] = vec
+                self._sim_keys.append(query)
+            else:
+                self._sim_emb[self._sim_pos] = vec
+                self._sim_keys[self._sim_pos] = query
+                self._sim_pos = (self._sim_pos + 1) % self._sim_cache_max
+
+        return results
 
     async def _propose_error_fix(
         self,
@@ -696,53 +1296,109 @@ class PyOSOrchestrator:
             Dicionário de argumentos corrigidos
         """
         corrected = tool_args.copy()
-        error_lower = error.lower()
-
-        # Padrão: Permission denied
-        if "permission denied" in error_lower:
-            if tool_name == "execute_command":
-                cmd = corrected.get("command", "")
-                if not cmd.startswith("sudo"):
-                    logger.info("  💡 Sugestão: Tentar com sudo")
-                    # Nota: Na prática, sudo requer auth
-                    corrected["command"] = f"sudo {cmd}"
-
-        # Padrão: File not found
-        elif "no such file" in error_lower or "not found" in error_lower:
-            logger.info("  💡 Sugestão: Verificar caminho/existência de arquivo")
-            # Poderia tentar listagem de diretório ou encontrar arquivo
-
-        # Padrão: Command not found
-        elif "command not found" in error_lower:
-            if tool_name == "execute_command":
-                cmd = corrected.get("command", "")
-                # Tentar variantes do comando
-                variants = {
-                    "python": "python3",
-                    "node": "nodejs",
-                    "pip": "pip3",
-                }
-                for old, new in variants.items():
-                    if cmd.startswith(old):
-                        corrected["command"] = cmd.replace(old, new, 1)
-                        logger.info(f"  💡 Tentando alternativa: {new}")
-                        break
+
+        # Uma única varredura linear sobre o erro: DFA Hyperscan quando
+        # disponível (escala a 100+ assinaturas), senão a alternação re.
+        # O padrão encontrado indexa o handler no dict.
+        handler_key: Optional[str] = None
+        if self._error_db is not None:
+            match_ids: list[int] = []
+            self._error_db.scan(
+                error.encode(),
+                match_event_handler=lambda pid, start, end, flags, ctx: match_ids.append(pid),
+            )
+            if match_ids:
+                # Menor id = padrão mais específico (ordem de _ERROR_PATTERNS)
+                handler_key = self._ERROR_PATTERNS[min(match_ids)]
+        else:
+            match = self._ERROR_PATTERN_RE.search(error)
+            if match is not None:
+                handler_key = match.group(0).lower()
+
+        if handler_key is not None:
+            self._ERROR_FIXES[handler_key](self, corrected, tool_name)
 
         return corrected
 
+    def _compile_error_db(self) -> Optional["hyperscan.Database"]:
+        """
+        Compila os padrões de erro da auto-cura em um banco Hyperscan.
+
+        Returns:
+            Banco compilado ou None quando a biblioteca está ausente.
+        """
+        if hyperscan is None:
+            return None
+
+        try:
+            db = hyperscan.Database()
+            expressions = [p.encode() for p in self._ERROR_PATTERNS]
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+                * len(expressions),
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Falha ao compilar banco Hyperscan de erros: {e}")
+            return None
+
+    def _fix_permission_denied(self, corrected: dict[str, Any], tool_name: str) -> None:
+        """Correção para 'permission denied': prefixar sudo no comando."""
+        if tool_name == "execute_command":
+            cmd = corrected.get("command", "")
+            if not cmd.startswith("sudo"):
+                logger.info("  💡 Sugestão: Tentar com sudo")
+                # Nota: Na prática, sudo requer auth
+                corrected["command"] = f"sudo {cmd}"
+
+    def _fix_file_not_found(self, corrected: dict[str, Any], tool_name: str) -> None:
+        """Correção para arquivo inexistente: apenas sugerir verificação."""
+        logger.info("  💡 Sugestão: Verificar caminho/existência de arquivo")
+        # Poderia tentar listagem de diretório ou encontrar arquivo
+
+    def _fix_command_not_found(self, corrected: dict[str, Any], tool_name: str) -> None:
+        """Correção para 'command not found': tentar variantes conhecidas."""
+        if tool_name == "execute_command":
+            cmd = corrected.get("command", "")
+            for old, new in self._CMD_VARIANTS.items():
+                if cmd.startswith(old):
+                    corrected["command"] = cmd.replace(old, new, 1)
+                    logger.info(f"  💡 Tentando alternativa: {new}")
+                    break
+
+    # Em ordem de prioridade: "command not found" precede "not found"
+    # (o id menor vence no Hyperscan; na alternação re, o padrão mais
+    # específico vence na mesma posição)
+    _ERROR_PATTERNS = (
+        "permission denied",
+        "no such file",
+        "command not found",
+        "not found",
+    )
+
+    _ERROR_PATTERN_RE = re.compile(
+        r"permission denied|no such file|command not found|not found",
+        re.IGNORECASE,
+    )
+
+    _CMD_VARIANTS = {
+        "python": "python3",
+        "node": "nodejs",
+        "pip": "pip3",
+    }
+
+    _ERROR_FIXES: dict[str, Callable[..., None]] = {
+        "permission denied": _fix_permission_denied,
+        "no such file": _fix_file_not_found,
+        "not found": _fix_file_not_found,
+        "command not found": _fix_command_not_found,
+    }
+
     def _format_action_log(self) -> list[dict[str, Any]]:
         """Formata log de ações para saída."""
-        return [
-            {
-                "iteration": log.iteration,
-                "type": log.action_type,
-                "tool": log.tool_name,
-                "success": log.success,
-                "security_validated": log.security_validated,
-                "details": log.details,
-            }
-            for log in self.action_log
-        ]
+        return self.action_log.to_dicts()
 
     def get_status(self) -> dict[str, Any]:
         """
@@ -19,13 +19,70 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import hashlib
+import os
 import re
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from functools import wraps
+from itertools import islice
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Optional, Set
+from typing import Any, Callable, Iterable, Optional, Set
 from loguru import logger
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Parâmetros compartilhados dos filtros de Bloom deste módulo: 256 bits
+# com 4 hashes cobre bem os conjuntos pequenos de comandos/keywords
+_BLOOM_BITS = 256
+_BLOOM_HASHES = 4
+
+
+def _bloom_positions(token: str) -> list[int]:
+    """Posições de bits para um token (double hashing de Kirsch-Mitzenmacher)."""
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % _BLOOM_BITS for i in range(_BLOOM_HASHES)]
+
+
+def _bloom_may_contain(bloom: int, token: str) -> bool:
+    """Testa se o token pode estar no conjunto representado pelo filtro."""
+    return all(bloom >> pos & 1 for pos in _bloom_positions(token))
+
+
+@lru_cache(maxsize=4096)
+def _resolve_cached(path_str: str) -> Path:
+    """
+    Resolve um caminho com memoização.
+
+    Path.resolve() faz um stat-walk (syscalls) para resolver symlinks;
+    o agente revisita os mesmos diretórios centenas de vezes por sessão,
+    então o resultado é cacheado por string. Invalidar com
+    SecurityShield.clear_path_cache() quando o filesystem mudar.
+    """
+    return Path(path_str).resolve()
+
 
 class SecurityViolationError(Exception):
     """Exceção raised quando uma violação de segurança é detectada."""
@@ -55,13 +112,101 @@ class SecurityShield:
         """
         self.allowed_commands: Set[str] = set()
         self.allowed_paths: Set[Path] = set()
+        # Espelho em string da allowlist de caminhos: a checagem de
+        # ancestral vira sondas de hash O(profundidade) em vez de N
+        # relative_to() guiados por exceção. O contador de versão
+        # invalida a memoização quando a allowlist muda.
+        self._allowed_path_strs: Set[str] = set()
+        # Filtro de Bloom "definitivamente não permitido" sobre os
+        # comandos: um miss rejeita sem tocar o set nem os padrões
+        self._cmd_bloom = 0
+        self._allow_version = 0
+        self._path_cache: OrderedDict[str, tuple[int, bool]] = OrderedDict()
+        self._path_cache_max = 1024
+        # Memoização dos veredictos de comando: repetir o mesmo comando
+        # (caso comum do agente) vira um lookup de dict em vez de refazer
+        # Bloom + varredura de padrões. Versionado pelo mesmo contador
+        # da allowlist, então mutações invalidam de graça.
+        self._cmd_cache: OrderedDict[str, tuple[int, bool]] = OrderedDict()
         self.blocked_patterns: list[re.Pattern[str]] = [
-            re.compile(r"rm\s+-rf\s+/"),  # Comandos destrutivos
-            re.compile(r"mkfs"),  # Formatação de disco
-            re.compile(r"dd\s+if=.*of=/dev"),  # Operações de dispositivos
+            re.compile(r"rm\s+-rf\s+/", re.IGNORECASE),  # Comandos destrutivos
+            re.compile(r"mkfs", re.IGNORECASE),  # Formatação de disco
+            re.compile(r"dd\s+if=.*of=/dev", re.IGNORECASE),  # Operações de dispositivos
         ]
+        # Fallback sem Hyperscan: uma única alternação compilada varre
+        # todos os padrões em um passe, em vez de N buscas sequenciais.
+        # Com re2 instalado a alternação roda no RE2 (NFA de Thompson,
+        # tempo linear garantido — imune a ReDoS); senão, re da stdlib.
+        blocked_src = "|".join(f"(?:{p.pattern})" for p in self.blocked_patterns)
+        self._blocked_re = self._compile_blocked_re(blocked_src)
+        self._blocked_db = self._compile_blocked_db()
         logger.info("SecurityShield inicializado com sucesso")
 
+    @staticmethod
+    def _compile_blocked_re(pattern_src: str):
+        """
+        Compila a alternação de padrões bloqueados (re2 quando possível).
+
+        Args:
+            pattern_src: Alternação já montada dos padrões.
+
+        Returns:
+            Padrão compilado com interface .search().
+        """
+        if re2 is not None:
+            try:
+                return re2.compile(pattern_src, re2.IGNORECASE)
+            except Exception as e:
+                logger.warning(f"Falha ao compilar padrões com re2: {e}")
+        return re.compile(pattern_src, re.IGNORECASE)
+
+    def _compile_blocked_db(self) -> Optional["hyperscan.Database"]:
+        """
+        Compila os padrões bloqueados em um banco Hyperscan (DFA).
+
+        Com Hyperscan disponível, a validação vira uma única varredura
+        O(N) sobre o comando, independente do número de padrões. Sem a
+        biblioteca, is_command_allowed usa a lista de re.Pattern.
+
+        Returns:
+            Banco Hyperscan compilado ou None se indisponível.
+        """
+        if hyperscan is None:
+            return None
+
+        try:
+            db = hyperscan.Database()
+            expressions = [p.pattern.encode() for p in self.blocked_patterns]
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+                * len(expressions),
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Falha ao compilar banco Hyperscan: {e}")
+            return None
+
+    def _matches_blocked_pattern(self, command: str) -> bool:
+        """Verifica se o comando bate em algum padrão bloqueado."""
+        if self._blocked_db is not None:
+            hit = [False]
+
+            def _on_match(pattern_id: int, start: int, end: int, flags: int, ctx: Any) -> int:
+                hit[0] = True
+                return 1  # aborta a varredura no primeiro match
+
+            try:
+                # encode único; caseless no banco dispensa command.lower()
+                self._blocked_db.scan(command.encode(), match_event_handler=_on_match)
+            except Exception:
+                # Varredura terminada cedo pelo handler conta como match
+                pass
+            return hit[0]
+
+        return self._blocked_re.search(command) is not None
+
     def add_allowed_command(self, command: str) -> None:
         """
         Adiciona um comando à lista de permitidos.
@@ -81,8 +226,40 @@ class SecurityShield:
         
         normalized = command.strip().lower()
         self.allowed_commands.add(normalized)
+        for pos in _bloom_positions(normalized):
+            self._cmd_bloom |= 1 << pos
+        self._allow_version += 1
         logger.debug(f"Comando permitido adicionado: {normalized}")
 
+    def add_allowed_commands(self, commands: Iterable[str]) -> None:
+        """
+        Adiciona vários comandos à lista de permitidos de uma vez.
+
+        Valida todos os comandos primeiro e faz uma única atualização
+        do conjunto, evitando N chamadas individuais.
+
+        Args:
+            commands: Iterável de comandos a autorizar.
+
+        Raises:
+            ValueError: Se algum comando estiver vazio.
+
+        Example:
+            >>> shield.add_allowed_commands(("ls", "grep", "find"))
+        """
+        normalized = []
+        for command in commands:
+            if not command or not isinstance(command, str):
+                raise ValueError("Comando deve ser uma string não vazia")
+            normalized.append(command.strip().lower())
+
+        self.allowed_commands.update(normalized)
+        for cmd in normalized:
+            for pos in _bloom_positions(cmd):
+                self._cmd_bloom |= 1 << pos
+        self._allow_version += 1
+        logger.debug(f"Comandos permitidos adicionados: {normalized}")
+
     def add_allowed_path(self, path: str | Path) -> None:
         """
         Adiciona um caminho à lista de permitidos.
@@ -97,15 +274,28 @@ class SecurityShield:
             >>> shield.add_allowed_path("/home/user/documents")
             >>> shield.add_allowed_path(Path.home())
         """
-        p = Path(path).resolve()
+        p = _resolve_cached(str(path))
         
         if not p.exists():
             logger.warning(f"Caminho não existe: {p}")
             raise ValueError(f"Caminho não existe: {p}")
         
         self.allowed_paths.add(p)
+        self._allowed_path_strs.add(str(p))
+        self._allow_version += 1
         logger.debug(f"Caminho permitido adicionado: {p}")
 
+    def clear_path_cache(self) -> None:
+        """
+        Limpa a memoização de resolução de caminhos (FS mudou).
+
+        Como os vereditos de is_path_allowed dependem da resolução de
+        symlinks, o contador de versão também é avançado para que
+        vereditos memoizados sobre resoluções antigas não sobrevivam.
+        """
+        _resolve_cached.cache_clear()
+        self._allow_version += 1
+
     def is_command_allowed(self, command: str) -> bool:
         """
         Verifica se um comando é permitido.
@@ -122,18 +312,102 @@ class SecurityShield:
         """
         if not command:
             return False
-        
-        # Extrai primeira palavra (comando principal)
-        cmd_name = command.strip().split()[0].lower()
-        
-        # Verifica padrões bloqueados
-        for pattern in self.blocked_patterns:
-            if pattern.search(command.lower()):
-                logger.warning(f"Comando bloqueado por padrão: {command}")
-                return False
-        
+
+        cached = self._cmd_cache.get(command)
+        if cached is not None and cached[0] == self._allow_version:
+            self._cmd_cache.move_to_end(command)
+            return cached[1]
+
+        allowed = self._check_command(command)
+        self._cmd_cache[command] = (self._allow_version, allowed)
+        self._cmd_cache.move_to_end(command)
+        if len(self._cmd_cache) > self._path_cache_max:
+            self._cmd_cache.popitem(last=False)
+        return allowed
+
+    def _check_command(self, command: str) -> bool:
+        """Avaliação real (não memoizada) de is_command_allowed."""
+        # Extrai primeira palavra (comando principal); maxsplit=1 evita
+        # tokenizar o comando inteiro só para usar o primeiro item
+        cmd_name = command.split(None, 1)[0].lower()
+
+        # Rejeição rápida: comando fora do filtro de Bloom com certeza
+        # não está na AllowList, então a varredura de padrões é dispensada
+        if not _bloom_may_contain(self._cmd_bloom, cmd_name):
+            return False
+
+        # Verifica padrões bloqueados (uma varredura caseless, DFA quando
+        # disponível; os re.Pattern do fallback usam IGNORECASE)
+        if self._matches_blocked_pattern(command):
+            logger.warning(f"Comando bloqueado por padrão: {command}")
+            return False
+
         return cmd_name in self.allowed_commands
 
+    def is_any_command_blocked(self, commands: list[str]) -> bool:
+        """
+        Verifica em lote se algum comando dispara um padrão bloqueado.
+
+        Cada comando é varrido individualmente, mas sempre em um único
+        passe da alternação compilada (ou do banco Hyperscan) — nunca o
+        loop de N padrões por comando. Unir o lote em um buffer só não
+        é seguro: "." casa com o separador, então padrões com ".*"
+        casariam atravessando a fronteira entre dois comandos inocentes.
+
+        Args:
+            commands: Lista de comandos a varrer.
+
+        Returns:
+            True se qualquer comando casa com um padrão bloqueado.
+
+        Example:
+            >>> shield.is_any_command_blocked(["ls", "rm -rf /"])
+            True
+        """
+        return any(self._matches_blocked_pattern(cmd) for cmd in commands)
+
+    def is_command_allowed_batch(self, commands: list[str]) -> "Any":
+        """
+        Classifica um lote de comandos contra a AllowList de uma vez.
+
+        O primeiro token de cada comando é comparado ao conjunto
+        permitido via np.isin (loop em C sobre o lote inteiro); os
+        padrões bloqueados só são varridos comando a comando se o passe
+        único em lote acusar algum match — o caso comum de lote limpo
+        custa uma varredura só.
+
+        Args:
+            commands: Lista de comandos a classificar.
+
+        Returns:
+            Máscara booleana (np.ndarray com numpy instalado, senão
+            list[bool]) paralela à lista de entrada.
+
+        Example:
+            >>> shield.is_command_allowed_batch(["ls", "rm -rf /"])
+            array([ True, False])
+        """
+        if np is None:
+            # Fallback sem numpy: caminho unitário já memoizado
+            return [self.is_command_allowed(cmd) for cmd in commands]
+
+        firsts = np.array(
+            [cmd.split(None, 1)[0].lower() if cmd.strip() else "" for cmd in commands]
+        )
+        if self.allowed_commands:
+            mask = np.isin(firsts, np.array(sorted(self.allowed_commands)))
+        else:
+            mask = np.zeros(len(commands), dtype=bool)
+
+        # Varredura de bloqueio por comando apenas quando o passe em
+        # lote detecta pelo menos um padrão no buffer unido
+        if mask.any() and self.is_any_command_blocked(commands):
+            for i in np.flatnonzero(mask):
+                if self._matches_blocked_pattern(commands[i]):
+                    mask[i] = False
+
+        return mask
+
     def is_path_allowed(self, path: str | Path) -> bool:
         """
         Verifica se um caminho é permitido.
@@ -148,17 +422,34 @@ class SecurityShield:
             >>> shield.is_path_allowed("/home/user/documents")
             True
         """
-        p = Path(path).resolve()
-        
-        # Verifica se o caminho ou um de seus pais está na AllowList
-        for allowed_path in self.allowed_paths:
-            try:
-                p.relative_to(allowed_path)
-                return True
-            except ValueError:
-                continue
-        
-        return False
+        key = str(path)
+        cached = self._path_cache.get(key)
+        if cached is not None and cached[0] == self._allow_version:
+            self._path_cache.move_to_end(key)
+            return cached[1]
+
+        # Resolve symlinks antes das sondas: um link dentro de um
+        # diretório permitido apontando para fora da allowlist NÃO pode
+        # passar (normalização puramente léxica deixaria). A resolução
+        # é memoizada, então caminhos repetidos continuam custando um
+        # lookup; como a allowlist também é armazenada resolvida, a
+        # comparação de ancestrais segue sendo sondas puras de hash.
+        probe = str(_resolve_cached(key))
+        allowed = False
+        while True:
+            if probe in self._allowed_path_strs:
+                allowed = True
+                break
+            parent = os.path.dirname(probe)
+            if parent == probe:
+                break
+            probe = parent
+
+        self._path_cache[key] = (self._allow_version, allowed)
+        if len(self._path_cache) > self._path_cache_max:
+            self._path_cache.popitem(last=False)
+
+        return allowed
 
     def validate_command(self, command: str) -> None:
         """
@@ -286,8 +577,9 @@ class PythonASTValidator:
     - Network operations to suspicious hosts
     """
 
-    # Dangerousimports that require approval
-    DANGEROUS_IMPORTS = {
+    # Dangerousimports that require approval (frozenset: immutable,
+    # cached hash, fastest membership test on CPython)
+    DANGEROUS_IMPORTS = frozenset({
         "os.system",
         "os.popen",
         "subprocess.call",
@@ -299,10 +591,17 @@ class PythonASTValidator:
         "exec",
         "compile",
         "__import__",
-    }
+    })
+
+    # Top-level modules of the dangerous imports, for the cheap
+    # prefilter in visit_ImportFrom
+    DANGEROUS_MODULES = frozenset(x.split(".", 1)[0] for x in DANGEROUS_IMPORTS)
+
+    # Names that are dangerous regardless of the module they come from
+    DANGEROUS_FROM_NAMES = frozenset({"system", "popen", "call", "Popen"})
 
     # Built-in functions that are risky
-    DANGEROUS_BUILTINS = {
+    DANGEROUS_BUILTINS = frozenset({
         "eval",
         "exec",
         "compile",
@@ -310,7 +609,7 @@ class PythonASTValidator:
         "__import__",
         "globals",
         "locals",
-    }
+    })
 
     def __init__(self, shield: Optional[SecurityShield] = None):
         """
@@ -321,17 +620,48 @@ class PythonASTValidator:
         """
         self.shield = shield
         self.violations: list[str] = []
+        # Content-addressed memoization: the agent frequently regenerates
+        # identical scripts, so repeated validations become an O(1)
+        # lookup keyed by a 128-bit blake2b digest instead of holding
+        # the full source as the cache key. Per-instance, so entries
+        # never leak across different shields.
+        self._validate_cache: OrderedDict[bytes, tuple[bool, tuple[str, ...]]] = OrderedDict()
+        self._validate_cache_max = 1024
+        # Specialized name check generated with exec (same technique as
+        # the orchestrator's tool wrappers): the dangerous-builtin names
+        # and their violation messages are inlined as constant compares,
+        # so the hot call-node path does no set hashing or f-string work
+        lines = ["def _check_name(name, out):"]
+        for name in sorted(self.DANGEROUS_BUILTINS):
+            message = f"Dangerous builtin call: {name}()"
+            lines.append(f"    if name == {name!r}:")
+            lines.append(f"        out.append({message!r})")
+            lines.append("        return")
+        namespace: dict[str, Any] = {}
+        exec(compile("\n".join(lines), "<dangerous_name_check>", "exec"), namespace)
+        self._check_name = namespace["_check_name"]
 
     def validate_python_code(self, code: str) -> tuple[bool, list[str]]:
         """
         Validate Python code through AST analysis.
         
+        Results are memoized by content hash; re-validating an identical
+        script skips the parse and the tree walk entirely.
+
         Args:
             code: Python code string to validate
             
         Returns:
             (is_safe, list_of_violations)
         """
+        key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+        cached = self._validate_cache.get(key)
+        if cached is not None:
+            self._validate_cache.move_to_end(key)
+            is_safe, violations = cached
+            self.violations = list(violations)
+            return is_safe, self.violations
+
         self.violations = []
 
         try:
@@ -340,62 +670,74 @@ class PythonASTValidator:
             self.violations.append(f"Syntax error: {e}")
             return False, self.violations
 
-        # Walk the AST and check for dangerous patterns
+        # Single traversal with dict dispatch: one hash lookup on the
+        # node's concrete type per node, with no handler call at all for
+        # the (majority of) node types that have nothing to check
+        handlers = self._HANDLERS
         for node in ast.walk(tree):
-            self._check_import(node)
-            self._check_function_call(node)
-            self._check_builtin_call(node)
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(self, node)
 
         is_safe = len(self.violations) == 0
         if not is_safe:
             logger.warning(f"Python code validation failed: {self.violations}")
 
-        return is_safe, self.violations
+        self._validate_cache[key] = (is_safe, tuple(self.violations))
+        if len(self._validate_cache) > self._validate_cache_max:
+            self._validate_cache.popitem(last=False)
 
-    def _check_import(self, node: ast.stmt) -> None:
-        """Check for dangerous imports."""
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                if alias.name in self.DANGEROUS_IMPORTS:
-                    self.violations.append(f"Dangerous import: {alias.name}")
+        return is_safe, self.violations
 
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
+    def _handle_import(self, node: ast.Import) -> None:
+        """Check plain imports against the dangerous-import set."""
+        for alias in node.names:
+            if alias.name in self.DANGEROUS_IMPORTS:
+                self.violations.append(f"Dangerous import: {alias.name}")
+
+    def _handle_importfrom(self, node: ast.ImportFrom) -> None:
+        """Check from-imports, skipping the common all-safe case early."""
+        if node.module:
+            # Prefiltro: se nem o módulo nem os nomes são suspeitos
+            # (o caso comum), nenhuma f-string é construída
+            if (
+                node.module.split(".", 1)[0] in self.DANGEROUS_MODULES
+                or any(a.name in self.DANGEROUS_FROM_NAMES for a in node.names)
+            ):
                 full_name = node.module
                 for alias in node.names:
                     full_import = f"{full_name}.{alias.name}"
                     if full_import in self.DANGEROUS_IMPORTS:
                         self.violations.append(f"Dangerous import: {full_import}")
-                    if alias.name in ("system", "popen", "call", "Popen"):
+                    if alias.name in self.DANGEROUS_FROM_NAMES:
                         self.violations.append(f"Dangerous import: {full_import}")
 
-    def _check_function_call(self, node: ast.expr) -> None:
-        """Check for dangerous function calls."""
-        if isinstance(node, ast.Call):
-            # Check for eval/exec/compile calls
-            if isinstance(node.func, ast.Name):
-                if node.func.id in self.DANGEROUS_BUILTINS:
-                    self.violations.append(f"Dangerous builtin call: {node.func.id}()")
-            
-            # Check for getattr/setattr abuse
-            elif isinstance(node.func, ast.Attribute):
-                if node.func.attr in ("__import__", "__class__", "__bases__"):
-                    self.violations.append(f"Dangerous attribute access: {node.func.attr}")
-
-    def _check_builtin_call(self, node: ast.expr) -> None:
-        """Check for builtin function calls that might be dangerous."""
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                if node.func.id == "open":
-                    # Check file operations (if shield available)
-                    if self.shield and node.args:
-                        if isinstance(node.args[0], ast.Constant):
-                            filepath = node.args[0].value
-                            if isinstance(filepath, str):
-                                if not self.shield.is_path_allowed(filepath):
-                                    self.violations.append(
-                                        f"File access not allowed: {filepath}"
-                                    )
+    def _handle_call(self, node: ast.Call) -> None:
+        """Check calls: dangerous builtins, open() paths, dunder access."""
+        func = node.func
+        if isinstance(func, ast.Name):
+            self._check_name(func.id, self.violations)
+            if func.id == "open":
+                # Check file operations (if shield available)
+                if self.shield and node.args and isinstance(node.args[0], ast.Constant):
+                    filepath = node.args[0].value
+                    if isinstance(filepath, str) and not self.shield.is_path_allowed(filepath):
+                        self.violations.append(
+                            f"File access not allowed: {filepath}"
+                        )
+
+        # Check for getattr/setattr abuse
+        elif isinstance(func, ast.Attribute):
+            if func.attr in ("__import__", "__class__", "__bases__"):
+                self.violations.append(f"Dangerous attribute access: {func.attr}")
+
+    # Um handler por tipo concreto de nó; tipos ausentes do dict não
+    # pagam nem a chamada
+    _HANDLERS: dict[type, Callable[..., None]] = {
+        ast.Import: _handle_import,
+        ast.ImportFrom: _handle_importfrom,
+        ast.Call: _handle_call,
+    }
 
     def get_violations_report(self) -> str:
         """Get formatted report of violations."""
@@ -430,6 +772,17 @@ class ApprovalManager:
         "reboot", "shutdown", "halt",
     }
 
+    # Prefilter preserving the substring semantics of the exact scan:
+    # if a command contains any critical keyword as a substring, every
+    # bigram of that keyword — hence at least one member of this set —
+    # appears in the command. No bigram hit means definitely not
+    # critical; a hit only costs the exact scan, never a wrong answer.
+    _CRITICAL_BIGRAMS: frozenset[str] = frozenset(
+        keyword[i:i + 2] for keyword in CRITICAL_KEYWORDS for i in range(len(keyword) - 1)
+    )
+
+    _critical_automaton: Optional["ahocorasick.Automaton"] = None
+
     def __init__(self, auto_approve: bool = False):
         """
         Initialize approval manager.
@@ -439,12 +792,29 @@ class ApprovalManager:
         """
         self.auto_approve = auto_approve
         self.approved_actions: set[str] = set()
-        self.approval_history: list[dict[str, Any]] = []
+        # Bounded history: O(1) append with automatic trimming instead
+        # of an ever-growing list in long sessions
+        self.approval_history: deque[dict[str, Any]] = deque(maxlen=1000)
+
+        # Aho-Corasick automaton for the exact phase: one linear pass
+        # over the command instead of K independent substring scans
+        if ahocorasick is not None and ApprovalManager._critical_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.CRITICAL_KEYWORDS:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            ApprovalManager._critical_automaton = automaton
 
     def is_critical(self, command: str) -> bool:
         """
         Check if a command is critical and requires approval.
         
+        Fast path: the command's character bigrams are probed against
+        the keyword-bigram set; if none hits, no keyword can occur as a
+        substring (embedded ones included, e.g. "dd" inside "ddrescue")
+        and the exact scan is skipped. Only a bigram hit falls through
+        to the exact substring check.
+
         Args:
             command: Command string to check
             
@@ -452,6 +822,14 @@ class ApprovalManager:
             True if command contains critical keywords
         """
         cmd_lower = command.lower()
+
+        bigrams = self._CRITICAL_BIGRAMS
+        if not any(cmd_lower[i:i + 2] in bigrams for i in range(len(cmd_lower) - 1)):
+            return False
+
+        if self._critical_automaton is not None:
+            return next(self._critical_automaton.iter(cmd_lower), None) is not None
+
         for keyword in self.CRITICAL_KEYWORDS:
             if keyword in cmd_lower:
                 return True
@@ -489,15 +867,11 @@ class ApprovalManager:
         if context:
             logger.warning(f"   Context: {context}")
 
-        # Basic console approval for development
-        try:
-            from rich.prompt import Confirm
-            approved = Confirm.ask(f"[bold yellow]Autorizar ação: {action}?[/bold yellow]")
-        except (ImportError, Exception):
-            # Fallback to standard input if rich fails or in non-interactive environment
-            print(f"⚠️  APROVAÇÃO NECESSÁRIA: {action}")
-            response = input("Autorizar? (y/n): ").lower()
-            approved = response in ("y", "yes", "s", "sim")
+        # Basic console approval for development. The prompt blocks on
+        # stdin, so it runs in a worker thread: the event loop (tool
+        # timers, streaming, concurrent objectives) keeps running while
+        # the human decides.
+        approved = await asyncio.to_thread(self._prompt, action)
 
         if approved:
             self.approved_actions.add(action)
@@ -505,7 +879,8 @@ class ApprovalManager:
             self.approval_history.append({
                 "action": action,
                 "context": context,
-                "timestamp": datetime.now().isoformat() if "datetime" in dir() else None,
+                # Float epoch (8 bytes); formatted only when reporting
+                "timestamp": time.time(),
                 "approved": True,
             })
 
@@ -515,16 +890,32 @@ class ApprovalManager:
             if asyncio.iscoroutinefunction(callback):
                 await callback(approved)
             else:
-                callback(approved)
+                # Callbacks síncronos também saem do event loop
+                await asyncio.to_thread(callback, approved)
 
         return approved
 
+    @staticmethod
+    def _prompt(action: str) -> bool:
+        """Blocking console prompt (always called via asyncio.to_thread)."""
+        try:
+            from rich.prompt import Confirm
+            return Confirm.ask(f"[bold yellow]Autorizar ação: {action}?[/bold yellow]")
+        except (ImportError, Exception):
+            # Fallback to standard input if rich fails or in non-interactive environment
+            print(f"⚠️  APROVAÇÃO NECESSÁRIA: {action}")
+            response = input("Autorizar? (y/n): ").lower()
+            return response in ("y", "yes", "s", "sim")
+
     def get_approval_report(self) -> str:
         """Get report of approval history."""
         lines = [f"Approval History ({len(self.approval_history)} total):"]
-        for entry in self.approval_history[-10:]:  # Last 10
+        # islice over reversed: last 10 without allocating a slice copy
+        recent = list(islice(reversed(self.approval_history), 10))
+        for entry in reversed(recent):
             status = "✅" if entry["approved"] else "❌"
-            lines.append(f"  {status} {entry['action']}")
+            when = datetime.fromtimestamp(entry["timestamp"]).isoformat() if entry.get("timestamp") else ""
+            lines.append(f"  {status} {entry['action']} {when}")
         
         return "\n".join(lines)
 
@@ -1,76 +1,303 @@
-"""
-Terminal tools for PyOS-Agent.
-"""
-
-import subprocess
-import time
-from typing import Any, Optional
-from loguru import logger
-
-from pyos.plugins.base import BaseTool, ToolResult
-
-class ExecuteCommandTool(BaseTool):
-    """
-    Executes a shell command on the host system.
-    Requires security validation from the orchestrator.
-    """
-    
-    @property
-    def name(self) -> str:
-        return "execute_command"
-        
-    @property
-    def description(self) -> str:
-        return "Executes a shell command and returns output. Use with caution."
-        
-    @property
-    def category(self) -> str:
-        return "terminal"
-        
-    @property
-    def requires_approval(self) -> bool:
-        return True
-
-    async def execute(self, command: str, timeout: int = 30) -> ToolResult:
-        start_time = time.time()
-        try:
-            logger.info(f"Executing command: {command}")
-            process = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            execution_time = (time.time() - start_time) * 1000
-            
-            if process.returncode == 0:
-                return ToolResult(
-                    success=True,
-                    output=process.stdout,
-                    execution_time_ms=execution_time,
-                    metadata={"returncode": 0}
-                )
-            else:
-                return ToolResult(
-                    success=False,
-                    output=process.stdout,
-                    error=process.stderr or f"Command failed with exit code {process.returncode}",
-                    execution_time_ms=execution_time,
-                    metadata={"returncode": process.returncode}
-                )
-        except subprocess.TimeoutExpired:
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Command timed out after {timeout}s",
-                execution_time_ms=(time.time() - start_time) * 1000
-            )
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                output="",
-                error=str(e),
-                execution_time_ms=(time.time() - start_time) * 1000
-            )
+"""
+Terminal tools for PyOS-Agent.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shlex
+import subprocess
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from pyos.plugins.base import BaseTool, ToolResult
+
+
+class _LazyLogger:
+    """Defers the loguru import (tens of ms) until the first log call."""
+
+    def __getattr__(self, name: str) -> Any:
+        from loguru import logger
+        globals()["logger"] = logger
+        return getattr(logger, name)
+
+
+logger: Any = _LazyLogger()
+
+
+@lru_cache(maxsize=256)
+def _tokenize(command: str) -> tuple[str, ...]:
+    """Tokenize a command string once and cache the argv tuple."""
+    return tuple(shlex.split(command))
+
+
+class ExecuteCommandTool(BaseTool):
+    """
+    Executes a shell command on the host system.
+    Requires security validation from the orchestrator.
+    """
+    
+    @property
+    def name(self) -> str:
+        return "execute_command"
+        
+    @property
+    def description(self) -> str:
+        return "Executes a shell command and returns output. Use with caution."
+        
+    @property
+    def category(self) -> str:
+        return "terminal"
+        
+    @property
+    def requires_approval(self) -> bool:
+        return True
+
+    def __init__(self) -> None:
+        # Opt-in disk cache for idempotent commands (git status, uname,
+        # pip list...): empty by default, callers populate it with the
+        # first argv token of commands they consider pure-within-a-TTL.
+        self.cacheable_commands: set[str] = set()
+        self.cache_dir = Path.home() / ".cache" / "pyos-agent" / "cmd"
+
+    async def execute(
+        self,
+        command: str,
+        timeout: int = 30,
+        max_output_bytes: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> ToolResult:
+        start_time = time.time()
+        try:
+            logger.info(f"Executing command: {command}")
+            # Pre-tokenized argv skips the /bin/sh fork and shell parse,
+            # and avoids shell-injection by construction.
+            argv = _tokenize(command)
+
+            cache_key = None
+            if cache_ttl and argv and argv[0] in self.cacheable_commands:
+                cache_key = self._cache_key(argv)
+                hit = self._cache_get(cache_key, cache_ttl)
+                if hit is not None:
+                    return ToolResult(
+                        success=hit["returncode"] == 0,
+                        output=hit["stdout"],
+                        error=hit["stderr"] or None,
+                        execution_time_ms=(time.time() - start_time) * 1000,
+                        metadata={"returncode": hit["returncode"], "cached": True},
+                    )
+
+            if max_output_bytes is not None:
+                # Bounded read: stream at most N bytes of stdout and stop
+                # the child instead of buffering its full output. Runs in
+                # a worker thread so the blocking reads don't stall the loop.
+                return await asyncio.to_thread(
+                    self._execute_bounded, argv, timeout, max_output_bytes, start_time
+                )
+
+            # Async subprocess: the event loop stays free for other tools
+            # (LLM streaming, screenshots) while the command runs.
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                # Kill and reap so no zombie is left behind
+                process.kill()
+                await process.wait()
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Command timed out after {timeout}s",
+                    execution_time_ms=(time.time() - start_time) * 1000
+                )
+
+            execution_time = (time.time() - start_time) * 1000
+
+            if cache_key is not None:
+                self._cache_put(
+                    cache_key,
+                    stdout.decode(errors="replace"),
+                    stderr.decode(errors="replace"),
+                    process.returncode,
+                )
+
+            if process.returncode == 0:
+                return ToolResult(
+                    success=True,
+                    output=stdout.decode(errors="replace"),
+                    execution_time_ms=execution_time,
+                    metadata={"returncode": 0}
+                )
+            else:
+                return ToolResult(
+                    success=False,
+                    output=stdout.decode(errors="replace"),
+                    error=stderr.decode(errors="replace")
+                    or f"Command failed with exit code {process.returncode}",
+                    execution_time_ms=execution_time,
+                    metadata={"returncode": process.returncode}
+                )
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                output="",
+                error=str(e),
+                execution_time_ms=(time.time() - start_time) * 1000
+            )
+
+    def _cache_key(self, argv: tuple[str, ...]) -> str:
+        """Digest of (cwd, argv): same command from the same directory."""
+        payload = "\x00".join((os.getcwd(), *argv))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _cache_get(self, key: str, ttl: float) -> Optional[dict]:
+        """Return the cached entry for key if it exists and is fresh."""
+        entry_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry_path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("ts", 0) > ttl:
+            # Expired: drop the stale file so the directory stays small
+            try:
+                entry_path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _cache_put(self, key: str, stdout: str, stderr: str, returncode: int) -> None:
+        """Atomically persist a command result for later cache hits."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"stdout": stdout, "stderr": stderr,
+                     "returncode": returncode, "ts": time.time()},
+                    f,
+                )
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError as e:
+            logger.debug(f"Could not persist command cache: {e}")
+
+    async def execute_many(
+        self,
+        commands: list[str],
+        max_concurrency: int = 4,
+        fail_fast: bool = False,
+        timeout: int = 30,
+    ) -> list[ToolResult]:
+        """
+        Run several commands concurrently, bounded by max_concurrency.
+
+        Results come back in the same order as the input list, so
+        wall-clock time collapses to roughly max(command_time) instead
+        of the sum. With fail_fast, the first failing command cancels
+        every command that has not finished yet.
+
+        Args:
+            commands: Command strings to run.
+            max_concurrency: Maximum commands in flight at once.
+            fail_fast: Cancel pending commands on the first failure.
+            timeout: Per-command timeout in seconds.
+
+        Returns:
+            One ToolResult per command, in input order; cancelled slots
+            get a failed ToolResult marked "cancelled" in metadata.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _run(index: int, command: str) -> tuple[int, ToolResult]:
+            async with sem:
+                return index, await self.execute(command, timeout=timeout)
+
+        tasks = [asyncio.create_task(_run(i, cmd)) for i, cmd in enumerate(commands)]
+        results: list[Optional[ToolResult]] = [None] * len(commands)
+        try:
+            for future in asyncio.as_completed(tasks):
+                index, result = await future
+                results[index] = result
+                if fail_fast and not result.success:
+                    break
+        finally:
+            # Cancel whatever is still pending (no-op for done tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [
+            result
+            if result is not None
+            else ToolResult(
+                success=False,
+                output="",
+                error="Cancelled: an earlier command failed with fail_fast enabled",
+                metadata={"cancelled": True},
+            )
+            for result in results
+        ]
+
+    def _execute_bounded(
+        self,
+        argv: tuple[str, ...],
+        timeout: int,
+        max_output_bytes: int,
+        start_time: float,
+    ) -> ToolResult:
+        """
+        Run argv reading at most max_output_bytes of stdout.
+
+        Keeps memory constant for huge-output commands: once the limit
+        is hit the child is terminated instead of letting it fill a
+        full in-memory buffer that would be truncated anyway.
+        """
+        process = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            head = process.stdout.read(max_output_bytes)
+            truncated = len(head) == max_output_bytes
+            if truncated:
+                process.terminate()
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Command timed out after {timeout}s",
+                execution_time_ms=(time.time() - start_time) * 1000,
+            )
+
+        stderr = process.stderr.read(max_output_bytes).decode("utf-8", "replace")
+        output = head.decode("utf-8", "replace")
+        execution_time = (time.time() - start_time) * 1000
+
+        if truncated or process.returncode == 0:
+            return ToolResult(
+                success=True,
+                output=output,
+                execution_time_ms=execution_time,
+                metadata={"returncode": process.returncode, "truncated": truncated},
+            )
+
+        return ToolResult(
+            success=False,
+            output=output,
+            error=stderr or f"Command failed with exit code {process.returncode}",
+            execution_time_ms=execution_time,
+            metadata={"returncode": process.returncode, "truncated": False},
+        )
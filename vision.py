@@ -1,84 +1,252 @@
-"""
-Vision tools for PyOS-Agent.
-"""
-
-import time
-import base64
-from io import BytesIO
-from typing import Any, Optional
-from loguru import logger
-
-try:
-    import mss
-    from PIL import Image
-except ImportError:
-    mss = None
-    Image = None
-
-from pyos.plugins.base import BaseTool, ToolResult
-
-class TakeScreenshotTool(BaseTool):
-    """
-    Takes a screenshot of the current screen.
-    Useful for AI to understand the desktop state.
-    """
-    
-    @property
-    def name(self) -> str:
-        return "take_screenshot"
-        
-    @property
-    def description(self) -> str:
-        return "Captures the current screen and returns it as a base64 encoded string."
-        
-    @property
-    def category(self) -> str:
-        return "vision"
-
-    async def execute(self, monitor: int = 1, quality: int = 85) -> ToolResult:
-        start_time = time.time()
-        
-        if mss is None or Image is None:
-            return ToolResult(
-                success=False,
-                output="",
-                error="Required libraries (mss, Pillow) are not installed.",
-                execution_time_ms=(time.time() - start_time) * 1000
-            )
-            
-        try:
-            with mss.mss() as sct:
-                # Get the monitor info
-                if monitor > len(sct.monitors):
-                    monitor = 1
-                    
-                screenshot = sct.grab(sct.monitors[monitor])
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                
-                # Resize if too large (optional optimization)
-                # img.thumbnail((1280, 720))
-                
-                buffered = BytesIO()
-                img.save(buffered, format="JPEG", quality=quality)
-                img_str = base64.b64encode(buffered.getvalue()).decode()
-                
-                execution_time = (time.time() - start_time) * 1000
-                
-                return ToolResult(
-                    success=True,
-                    output=img_str,
-                    execution_time_ms=execution_time,
-                    metadata={
-                        "size": screenshot.size,
-                        "format": "JPEG",
-                        "encoding": "base64"
-                    }
-                )
-        except Exception as e:
-            logger.error(f"Failed to take screenshot: {e}")
-            return ToolResult(
-                success=False,
-                output="",
-                error=str(e),
-                execution_time_ms=(time.time() - start_time) * 1000
-            )
+"""
+Vision tools for PyOS-Agent.
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+
+# pybase64 is API-compatible with stdlib base64 but uses SIMD
+# (AVX2/NEON) encode loops — a free swap when the package is present
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from io import BytesIO
+from typing import Any, Optional
+
+from pyos.plugins.base import BaseTool, ToolResult
+
+
+class _LazyLogger:
+    """Defers the loguru import (tens of ms) until the first log call."""
+
+    def __getattr__(self, name: str) -> Any:
+        from loguru import logger
+        globals()["logger"] = logger
+        return getattr(logger, name)
+
+
+logger: Any = _LazyLogger()
+
+# Heavy imports (Pillow alone is ~50 ms) are deferred to the first
+# capture so CLI-style runs that never screenshot skip them entirely.
+# After _ensure_imports() these hold the modules, or None if missing.
+mss: Any = None
+Image: Any = None
+np: Any = None
+_turbojpeg: Any = None
+TJPF_BGRX: Any = None
+TJPF_RGB: Any = None
+_imports_done = False
+
+
+def _ensure_imports() -> None:
+    """Import mss/PIL/numpy/turbojpeg once, on first capture."""
+    global mss, Image, np, _turbojpeg, TJPF_BGRX, TJPF_RGB, _imports_done
+    if _imports_done:
+        return
+    _imports_done = True
+
+    try:
+        import mss as _mss
+        from PIL import Image as _Image
+        mss, Image = _mss, _Image
+    except ImportError:
+        pass
+
+    try:
+        import numpy as _np
+        np = _np
+    except ImportError:
+        pass
+
+    # libjpeg-turbo backend: SIMD DCT/Huffman, typically 2-4x faster than
+    # PIL's stock libjpeg. The constructor raises if the native library is
+    # missing, so failures fall through to the PIL path.
+    try:
+        from turbojpeg import TurboJPEG, TJPF_BGRX as _bgrx, TJPF_RGB as _rgb
+        _turbojpeg = TurboJPEG()
+        TJPF_BGRX, TJPF_RGB = _bgrx, _rgb
+    except (ImportError, OSError, RuntimeError):
+        _turbojpeg = None
+
+
+# mss instances are not thread-safe, and _capture_and_encode runs on
+# asyncio's worker threads — so the cached handle is per-thread. Reuse
+# skips the display-connection / GDI setup mss pays on every mss.mss().
+_sct_local = threading.local()
+_sct_handles: list = []
+
+
+def _get_sct():
+    """Return this thread's cached mss handle, creating it on first use."""
+    sct = getattr(_sct_local, "handle", None)
+    if sct is None:
+        sct = mss.mss()
+        _sct_local.handle = sct
+        _sct_handles.append(sct)
+    return sct
+
+
+@atexit.register
+def _close_sct_handles() -> None:
+    """Close every cached mss handle at interpreter shutdown."""
+    for sct in _sct_handles:
+        try:
+            sct.close()
+        except Exception:
+            pass
+    _sct_handles.clear()
+
+
+def _capture_and_encode(
+    monitor: int, quality: int, max_dimension: int = 1280
+) -> tuple[str, tuple[int, int]]:
+    """
+    Grab one monitor and return (base64 JPEG, (width, height)).
+
+    Plain synchronous function so the tool can push it onto a worker
+    thread: grab + JPEG encode of a 1080p frame is ~100 ms of native
+    code that would otherwise stall the event loop.
+
+    Frames larger than max_dimension on either side are downscaled
+    first: vision LLMs downsample anyway, and a 4K→720p-class resize
+    cuts encode, base64 and token cost ~9x.
+    """
+    _ensure_imports()
+    sct = _get_sct()
+    if monitor > len(sct.monitors):
+        monitor = 1
+
+    screenshot = sct.grab(sct.monitors[monitor])
+
+    if _turbojpeg is not None and np is not None and max(screenshot.size) <= max_dimension:
+        # No resize needed: encode straight from the BGRA buffer,
+        # bypassing PIL and BytesIO entirely
+        width, height = screenshot.size
+        frame = np.frombuffer(screenshot.bgra, dtype=np.uint8).reshape(
+            height, width, 4
+        )
+        jpeg_bytes = _turbojpeg.encode(
+            frame, quality=quality, pixel_format=TJPF_BGRX
+        )
+        return base64.b64encode(jpeg_bytes).decode(), screenshot.size
+
+    # frombuffer reads straight from the mss BGRA buffer instead of
+    # frombytes' defensive copy — ~6 MB less alloc+copy per 1080p frame
+    img = Image.frombuffer(
+        "RGB", screenshot.size, screenshot.bgra, "raw", "BGRX", 0, 1
+    )
+
+    if max(img.size) > max_dimension:
+        # BILINEAR, not the LANCZOS default: 4x fewer filter taps and
+        # plenty of fidelity for LLM input
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.BILINEAR)
+
+    if _turbojpeg is not None and np is not None:
+        jpeg_bytes = _turbojpeg.encode(
+            np.asarray(img), quality=quality, pixel_format=TJPF_RGB
+        )
+        return base64.b64encode(jpeg_bytes).decode(), img.size
+
+    buffered = BytesIO()
+    img.save(buffered, format="JPEG", quality=quality)
+    # getbuffer() is a memoryview over the BytesIO internals; getvalue()
+    # would materialize a second full copy of the JPEG just to encode it
+    img_str = base64.b64encode(buffered.getbuffer()).decode("ascii")
+    return img_str, img.size
+
+
+class TakeScreenshotTool(BaseTool):
+    """
+    Takes a screenshot of the current screen.
+    Useful for AI to understand the desktop state.
+    """
+    
+    @property
+    def name(self) -> str:
+        return "take_screenshot"
+        
+    @property
+    def description(self) -> str:
+        return "Captures the current screen and returns it as a base64 encoded string."
+        
+    @property
+    def category(self) -> str:
+        return "vision"
+
+    async def execute(
+        self, monitor: int = 1, quality: int = 85, max_dimension: int = 1280
+    ) -> ToolResult:
+        start_time = time.time()
+
+        _ensure_imports()
+        if mss is None or Image is None:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Required libraries (mss, Pillow) are not installed.",
+                execution_time_ms=(time.time() - start_time) * 1000
+            )
+            
+        try:
+            # Capture + encode run in a worker thread so other coroutines
+            # (LLM streaming, subprocesses) keep running meanwhile
+            img_str, size = await asyncio.to_thread(
+                _capture_and_encode, monitor, quality, max_dimension
+            )
+
+            execution_time = (time.time() - start_time) * 1000
+
+            return ToolResult(
+                success=True,
+                output=img_str,
+                execution_time_ms=execution_time,
+                metadata={
+                    "size": size,
+                    "format": "JPEG",
+                    "encoding": "base64"
+                }
+            )
+        except Exception as e:
+            logger.error(f"Failed to take screenshot: {e}")
+            return ToolResult(
+                success=False,
+                output="",
+                error=str(e),
+                execution_time_ms=(time.time() - start_time) * 1000
+            )
+
+    async def capture_all(
+        self,
+        monitors: list[int],
+        quality: int = 85,
+        max_dimension: int = 1280,
+    ) -> list[ToolResult]:
+        """
+        Capture several monitors concurrently.
+
+        Each grab+encode runs on its own worker thread — PIL/libjpeg
+        release the GIL during encode, so threads genuinely overlap and
+        N-monitor wall time approaches max() instead of sum(). Results
+        come back in the same order as the monitors list.
+
+        Args:
+            monitors: Monitor indices to capture (as in execute()).
+            quality: JPEG quality for every frame.
+            max_dimension: Downscale bound for every frame.
+
+        Returns:
+            One ToolResult per monitor, in input order.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.execute(monitor=m, quality=quality, max_dimension=max_dimension)
+                    for m in monitors
+                )
+            )
+        )